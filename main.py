@@ -4,8 +4,10 @@ This module provides a simple example of how to create and run a bot
 using the vindinium client library.
 """
 
+import logging
+
 import vindinium
-from settings import settings
+from settings import get_settings
 
 
 def get_bot_class(bot_name):
@@ -49,6 +51,8 @@ def main():
     Creates a Vindinium client configured for training mode and runs
     the bot specified in settings. The game replay URL is printed after completion.
     """
+    settings = get_settings()
+
     # Validate settings
     try:
         settings.validate()
@@ -60,6 +64,13 @@ def main():
     # Display current settings
     settings.display()
 
+    # The client logs each move and its timing at DEBUG level; give the
+    # root logger a console handler so those records are visible.  urllib3
+    # chatters per-request at DEBUG, so keep it at INFO.
+    if settings.DEBUG:
+        logging.basicConfig(level=logging.DEBUG)
+        logging.getLogger("urllib3").setLevel(logging.INFO)
+
     # Get the bot class
     try:
         BotClass = get_bot_class(settings.BOT)
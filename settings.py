@@ -2,21 +2,22 @@
 
 This module loads configuration from a .env file in the project root.
 Create a .env file based on .env.example and set your values there.
+
+The .env file is only read when settings are first requested (via
+``get_settings()``), not at import time.
 """
 
+import functools
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-env_path = Path(__file__).parent / '.env'
-load_dotenv(dotenv_path=env_path)
-
 
 class Settings:
     """Game configuration settings.
 
     All settings are loaded from environment variables defined in .env file.
+    Use ``get_settings()`` to obtain the shared, lazily-created instance.
 
     Attributes:
         SERVER (str): Vindinium server URL.
@@ -26,79 +27,95 @@ class Settings:
         MODE (str): Game mode ('training' or 'arena').
         N_TURNS (int): Number of turns for training mode (10-300).
         OPEN_BROWSER (bool): Whether to open the game in browser automatically.
-        DEBUG (bool): Enable debug logging (prints each move and timing).
+        DEBUG (bool): Enable debug logging (logs each move and its timing
+            to the console via the ``logging`` module).
     """
 
-    # Vindinium server URL
-    SERVER = os.getenv('SERVER', '')
+    def __init__(self):
+        """Read all settings from the current environment."""
+        # Vindinium server URL
+        self.SERVER = os.getenv('SERVER', '')
+
+        # Your bot's API key
+        self.KEY = os.getenv('KEY', '')
 
-    # Your bot's API key
-    KEY = os.getenv('KEY', '')
+        # Your hero's name
+        self.HERO_NAME = os.getenv('HERO_NAME', '')
 
-    # Your hero's name
-    HERO_NAME = os.getenv('HERO_NAME', '')
+        # Bot class to use
+        self.BOT = os.getenv('BOT', 'MinerBot')
 
-    # Bot class to use
-    BOT = os.getenv('BOT', 'MinerBot')
+        # Game mode (training or arena)
+        self.MODE = os.getenv('MODE', 'training')
 
-    # Game mode (training or arena)
-    MODE = os.getenv('MODE', 'training')
+        # Number of turns (for training mode)
+        self.N_TURNS = int(os.getenv('N_TURNS', '10'))
 
-    # Number of turns (for training mode)
-    N_TURNS = int(os.getenv('N_TURNS', '10'))
+        # Open browser automatically
+        self.OPEN_BROWSER = os.getenv('OPEN_BROWSER', 'true').lower() in ('true', '1', 'yes')
 
-    # Open browser automatically
-    OPEN_BROWSER = os.getenv('OPEN_BROWSER', 'true').lower() in ('true', '1', 'yes')
+        # Debug mode (log each move and timing)
+        self.DEBUG = os.getenv('DEBUG', 'false').lower() in ('true', '1', 'yes')
 
-    # Debug mode (log each move and timing)
-    DEBUG = os.getenv('DEBUG', 'false').lower() in ('true', '1', 'yes')
-    
-    @classmethod
-    def validate(cls):
+    def validate(self):
         """Validate that required settings are configured.
-        
+
         Raises:
             ValueError: If required settings are missing.
         """
-        if not cls.KEY:
+        if not self.KEY:
             raise ValueError(
                 "KEY is not set. "
                 "Please create a .env file with your API key. "
                 "See .env.example for reference."
             )
-        
-        if not cls.SERVER:
+
+        if not self.SERVER:
             raise ValueError("SERVER is not set.")
-    
-    @classmethod
-    def display(cls):
+
+    def display(self):
         """Display current settings (with masked API key for security)."""
-        masked_key = cls.KEY[:4] + '****' if len(cls.KEY) > 4 else '****'
+        masked_key = self.KEY[:4] + '****' if len(self.KEY) > 4 else '****'
         print("=" * 60)
         print("VINDINIUM SETTINGS")
         print("=" * 60)
-        print(f"Server:       {cls.SERVER}")
+        print(f"Server:       {self.SERVER}")
         print(f"API Key:      {masked_key}")
-        print(f"Hero Name:    {cls.HERO_NAME}")
-        print(f"Bot:          {cls.BOT}")
-        print(f"Mode:         {cls.MODE}")
-        print(f"Turns:        {cls.N_TURNS}")
-        print(f"Open Browser: {cls.OPEN_BROWSER}")
-        print(f"Debug:        {cls.DEBUG}")
+        print(f"Hero Name:    {self.HERO_NAME}")
+        print(f"Bot:          {self.BOT}")
+        print(f"Mode:         {self.MODE}")
+        print(f"Turns:        {self.N_TURNS}")
+        print(f"Open Browser: {self.OPEN_BROWSER}")
+        print(f"Debug:        {self.DEBUG}")
         print("=" * 60)
 
 
-# Create a singleton instance
-settings = Settings()
+def __getattr__(name):
+    """Forward legacy module-level access to the shared Settings instance.
+
+    Older code (and the configuration docs) used ``from settings import
+    settings`` or module-level copies like ``SERVER``. Instead of snapshot
+    globals that go stale, resolve those names lazily against
+    ``get_settings()`` so there is a single source of truth.
+    """
+    if name == 'settings':
+        return get_settings()
+    instance = get_settings()
+    if hasattr(instance, name):
+        return getattr(instance, name)
+    raise AttributeError(f"module 'settings' has no attribute {name!r}")
 
 
-# Convenience exports
-SERVER = settings.SERVER
-KEY = settings.KEY
-HERO_NAME = settings.HERO_NAME
-BOT = settings.BOT
-MODE = settings.MODE
-N_TURNS = settings.N_TURNS
-OPEN_BROWSER = settings.OPEN_BROWSER
-DEBUG = settings.DEBUG
+@functools.lru_cache(maxsize=1)
+def get_settings():
+    """Get the shared Settings instance, loading the .env file on first use.
 
+    Deferring the .env parsing to the first call keeps the filesystem I/O
+    off the import path, and the cache makes every later call free.
+
+    Returns:
+        Settings: The cached settings instance.
+    """
+    env_path = Path(__file__).parent / '.env'
+    load_dotenv(dotenv_path=env_path)
+    return Settings()
@@ -35,19 +35,55 @@ Note: This client fixes the inconsistent axis of the server, so you don't have t
 worry about that (if you're using the game model).
 """
 
-from .client import *
-from . import bots
-from . import models
-from . import ai
-from . import utils
+import enum
+import importlib
+
+# Subpackages and attributes resolved lazily (PEP 562), so importing
+# vindinium doesn't pull in every bot and algorithm up front
+_LAZY_SUBMODULES = {"bots", "models", "ai", "utils"}
+_LAZY_ATTRIBUTES = {"Client": "vindinium.client"}
+
+
+def __getattr__(name):
+    """Import subpackages and re-exported classes on first access."""
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module("vindinium." + name)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+        value = getattr(module, name)
+    else:
+        raise AttributeError("module 'vindinium' has no attribute %r" % name)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List regular globals plus the lazily importable names."""
+    return sorted(set(globals()) | _LAZY_SUBMODULES | set(_LAZY_ATTRIBUTES))
+
 
 # CONSTANTS
 # Tile values
-TILE_EMPTY = 0
-TILE_WALL = 1
-TILE_SPAWN = 2
-TILE_TAVERN = 3
-TILE_MINE = 4
+class Tile(enum.IntEnum):
+    """Tile values of the game board."""
+
+    EMPTY = 0
+    WALL = 1
+    SPAWN = 2
+    TAVERN = 3
+    MINE = 4
+
+
+TILE_EMPTY = Tile.EMPTY
+TILE_WALL = Tile.WALL
+TILE_SPAWN = Tile.SPAWN
+TILE_TAVERN = Tile.TAVERN
+TILE_MINE = Tile.MINE
+
+# Tile groups (frozen so membership tests are O(1) hash lookups)
+OBSTACLE_TILES = frozenset({Tile.WALL, Tile.TAVERN, Tile.MINE})
+AVOID_TILES = frozenset({Tile.SPAWN})
 
 # Command values
 NORTH = "North"
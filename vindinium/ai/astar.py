@@ -4,8 +4,11 @@ This module provides an A* pathfinding implementation specialized
 for the Vindinium game map.
 """
 
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+
 import vindinium as vin
-from vindinium.utils import HeapQueue
 
 __all__ = ["AStar"]
 
@@ -22,8 +25,8 @@ class AStar:
         cost_avoid (float): Cost to walk over an avoidable tile (see avoid_tiles).
             Defaults to 4.
         cost_move (float): Cost to walk over an empty tile. Defaults to 1.
-        obstacle_tiles (list): List of obstacle tile values that cannot be traversed.
-        avoid_tiles (list): List of avoidable tile values with higher cost.
+        obstacle_tiles (frozenset): Obstacle tile values that cannot be traversed.
+        avoid_tiles (frozenset): Avoidable tile values with higher cost.
     """
 
     def __init__(self, map):
@@ -34,11 +37,40 @@ class AStar:
         """
         self.cost_avoid = 2
         self.cost_move = 1
-        self.obstacle_tiles = [vin.TILE_WALL, vin.TILE_TAVERN, vin.TILE_MINE]
-        self.avoid_tiles = [vin.TILE_SPAWN]
+        self.obstacle_tiles = vin.OBSTACLE_TILES
+        self.avoid_tiles = vin.AVOID_TILES
         self._map = map
+        # Cached BFS distance/parent fields, keyed by goal position. Bots
+        # query the same goals (mines, taverns) every turn while only the
+        # start moves, so one field per goal serves all future queries.
+        self._field_cache = {}
+
+        # Precompute flat obstacle/avoid bitmaps (indexed by y*size + x),
+        # replacing the per-neighbor tile lookup + list scans with a single
+        # O(1) byte read. The map tiles are static during a game.
+        size = map.size
+        self._obstacle_mask = obstacle_mask = bytearray(size * size)
+        self._avoid_mask = avoid_mask = bytearray(size * size)
+        for y in range(size):
+            for x in range(size):
+                tile = map[x, y]
+                if tile in self.obstacle_tiles:
+                    obstacle_mask[y * size + x] = 1
+                if tile in self.avoid_tiles:
+                    avoid_mask[y * size + x] = 1
+
+        # Reusable per-search buffers: node storage, open-list heap and an
+        # epoch-stamped closed set. Bumping the epoch invalidates the whole
+        # closed set in O(1), so searches allocate nothing per call.
+        self._xs = array("i")
+        self._ys = array("i")
+        self._gs = array("d")
+        self._parents = array("i")
+        self._heap = []
+        self._closed = array("i", [0]) * (size * size)
+        self._epoch = 0
 
-    def find(self, x0, y0, x1, y1):
+    def find(self, x0, y0, x1, y1, max_nodes=2000):
         """Find a path between two points using A* algorithm.
 
         Args:
@@ -46,6 +78,11 @@ class AStar:
             y0 (int): Initial position on the Y axis.
             x1 (int): Goal position on the X axis.
             y1 (int): Goal position on the Y axis.
+            max_nodes (int): Maximum number of node expansions before the
+                search gives up and returns the path to the most promising
+                node seen so far (lowest f). Bounds worst-case latency on
+                large or walled maps. Defaults to 2000, comfortably above
+                the tile count of the biggest Vindinium boards.
 
         Returns:
             list: A list of (x, y) tuples representing the path, e.g. ``[(0, 1), (0, 2), ...]``.
@@ -56,67 +93,350 @@ class AStar:
         cost_move = self.cost_move
         cost_avoid = self.cost_avoid
         map = self._map
+        avoid_mask = self._avoid_mask
+        obstacle_mask = self._obstacle_mask
         adjacent = False
 
         # If obstacle, cancel search
-        if map[x1, y1] in self.obstacle_tiles:
+        if self._obstacle_mask[y1 * map.size + x1]:
             adjacent = True
 
-        # State x, y, g, parent
-        start = (x0, y0, 0, None)
-        queue = HeapQueue()
-        visited = [(x0, y0)]
-        state = None
+        # With uniform costs the heap buys nothing: plain BFS expands nodes
+        # in cost order already and avoids the log(n) per push
+        if cost_avoid == cost_move:
+            return self.__search_bfs(x0, y0, x1, y1)
 
-        queue.push(start, 0)
-        while not queue.is_empty():
-            state = queue.pop()
-            x, y, g, parent = state
+        # Node storage as parallel arrays (structure-of-arrays), so the heap
+        # only carries small integer node ids instead of per-node tuples.
+        # The arrays, heap and closed set are instance buffers reset in
+        # place here, so repeated searches cause no allocator traffic
+        size = map.size
+        xs, ys, gs, parents, heap = self.__reset_buffers(x0, y0)
+        # Open list as a plain heapq of (f, counter, node_id) tuples; the
+        # monotonic counter breaks ties so comparisons never reach the
+        # node id, and the direct module calls skip wrapper dispatch
+        best_h = abs(x0 - x1) + abs(y0 - y1)
+        heap.append((best_h, 0, 0))
+        counter = 0
+        # Closed set as epoch-stamped ints indexed by y*size + x: bumping
+        # the epoch invalidates every previous stamp in O(1), with the
+        # same O(1) membership checks as a fresh bitmap
+        epoch = self._epoch
+        closed = self._closed
+        closed[y0 * size + x0] = epoch
+        node = None
+        best_node = 0
+        expanded = 0
+
+        while heap:
+            f, _, node = heappop(heap)
+            x = xs[node]
+            y = ys[node]
+            g = gs[node]
 
             # Goal
             if (x == x1 and y == y1) or (adjacent and (abs(x - x1) + abs(y - y1)) == 1):
                 break
 
-            # Children
-            for x_, y_ in self.__neighbors(x, y, visited):
-                tile = map[x_, y_]
-                g_ = g + (cost_avoid if tile in self.avoid_tiles else cost_move)
-                h_ = abs(x_ - x1) + abs(y_ - y1)
-                queue.push((x_, y_, g_, state), g_ + h_)
+            # Expansion cap: bail out toward the closest node seen (lowest
+            # heuristic) instead of letting a blocked goal blow the budget
+            if f - g < best_h:
+                best_h = f - g
+                best_node = node
+            expanded += 1
+            if expanded >= max_nodes:
+                if best_node == 0:
+                    return None
+                node = best_node
+                break
+
+            # Children: the four directions unrolled inline, replacing the
+            # old __neighbors generator (no generator frame or tuple
+            # packing per neighbor, and each branch stays predictable)
+            base = y * size
+            tx = x - 1
+            if tx >= 0:
+                idx = base + tx
+                if not obstacle_mask[idx] and closed[idx] != epoch:
+                    closed[idx] = epoch
+                    g_ = g + (cost_avoid if avoid_mask[idx] else cost_move)
+                    xs.append(tx)
+                    ys.append(y)
+                    gs.append(g_)
+                    parents.append(node)
+                    counter += 1
+                    heappush(heap, (g_ + abs(tx - x1) + abs(y - y1), counter, len(xs) - 1))
+            tx = x + 1
+            if tx < size:
+                idx = base + tx
+                if not obstacle_mask[idx] and closed[idx] != epoch:
+                    closed[idx] = epoch
+                    g_ = g + (cost_avoid if avoid_mask[idx] else cost_move)
+                    xs.append(tx)
+                    ys.append(y)
+                    gs.append(g_)
+                    parents.append(node)
+                    counter += 1
+                    heappush(heap, (g_ + abs(tx - x1) + abs(y - y1), counter, len(xs) - 1))
+            ty = y - 1
+            if ty >= 0:
+                idx = base - size + x
+                if not obstacle_mask[idx] and closed[idx] != epoch:
+                    closed[idx] = epoch
+                    g_ = g + (cost_avoid if avoid_mask[idx] else cost_move)
+                    xs.append(x)
+                    ys.append(ty)
+                    gs.append(g_)
+                    parents.append(node)
+                    counter += 1
+                    heappush(heap, (g_ + abs(x - x1) + abs(ty - y1), counter, len(xs) - 1))
+            ty = y + 1
+            if ty < size:
+                idx = base + size + x
+                if not obstacle_mask[idx] and closed[idx] != epoch:
+                    closed[idx] = epoch
+                    g_ = g + (cost_avoid if avoid_mask[idx] else cost_move)
+                    xs.append(x)
+                    ys.append(ty)
+                    gs.append(g_)
+                    parents.append(node)
+                    counter += 1
+                    heappush(heap, (g_ + abs(x - x1) + abs(ty - y1), counter, len(xs) - 1))
 
         # If while does not break, it means that it didn't found any path
         else:
             return None
 
-        # Prepare result
-        result = []
-        while state:
-            result.insert(0, (state[0], state[1]))
-            state = state[3]
-        result.pop(0)
+        return self.__build_path(xs, ys, parents, node)
+
+    def find_nearest(self, x0, y0, goals):
+        """Find the cheapest reachable goal among several candidates.
+
+        Runs a single Dijkstra expansion from the start, sharing one
+        frontier across every candidate instead of one full search per
+        goal. Goal tiles that are obstacles (mines, taverns) are reached
+        through their walkable neighbors, matching the "adjacent" goal
+        handling of ``find``. Movement costs (``cost_move``/``cost_avoid``)
+        are respected, so the result agrees with per-goal ``find`` calls.
+
+        Args:
+            x0 (int): Initial position on the X axis.
+            y0 (int): Initial position on the Y axis.
+            goals (iterable): Candidate (x, y) goal positions.
+
+        Returns:
+            tuple: ``((gx, gy), path)`` for the cheapest reachable goal,
+                where ``path`` follows the same convention as ``find`` and
+                is empty when the start is already adjacent to the goal.
+            None: If no goal is reachable.
+        """
+        size = self._map.size
+        obstacle_mask = self._obstacle_mask
+        avoid_mask = self._avoid_mask
+        cost_move = self.cost_move
+        cost_avoid = self.cost_avoid
+
+        # Map trigger tiles (the goal itself when walkable, its walkable
+        # neighbors otherwise) to the goal they complete
+        trigger = {}
+        for gx, gy in goals:
+            idx = gy * size + gx
+            if obstacle_mask[idx]:
+                for dx, dy in DIR_NEIGHBORS:
+                    tx, ty = gx + dx, gy + dy
+                    if -1 < tx < size and -1 < ty < size:
+                        idx_ = ty * size + tx
+                        if not obstacle_mask[idx_] and idx_ not in trigger:
+                            trigger[idx_] = (gx, gy)
+            elif idx not in trigger:
+                trigger[idx] = (gx, gy)
+        if not trigger:
+            return None
+
+        xs, ys, gs, parents, heap = self.__reset_buffers(x0, y0)
+        heap.append((0, 0, 0))
+        counter = 0
+        epoch = self._epoch
+        closed = self._closed
+        closed[y0 * size + x0] = epoch
+
+        while heap:
+            _, _, node = heappop(heap)
+            x = xs[node]
+            y = ys[node]
+            goal = trigger.get(y * size + x)
+            if goal is not None:
+                return goal, self.__build_path(xs, ys, parents, node)
+
+            g = gs[node]
+            for dx, dy in DIR_NEIGHBORS:
+                tx, ty = x + dx, y + dy
+                if -1 < tx < size and -1 < ty < size:
+                    idx = ty * size + tx
+                    if not obstacle_mask[idx] and closed[idx] != epoch:
+                        closed[idx] = epoch
+                        g_ = g + (cost_avoid if avoid_mask[idx] else cost_move)
+                        xs.append(tx)
+                        ys.append(ty)
+                        gs.append(g_)
+                        parents.append(node)
+                        counter += 1
+                        heappush(heap, (g_, counter, len(xs) - 1))
+
+        return None
+
+    def all_paths_to(self, x1, y1):
+        """Compute (and cache) BFS distance and parent fields toward a goal.
+
+        Runs a single breadth-first search outward from the goal across
+        non-obstacle tiles, producing flat arrays indexed by ``y*size + x``.
+        Once computed, a shortest path from any start position is an O(path)
+        parent-pointer walk, so repeated queries against the same goal (the
+        common pattern when chasing a mine or tavern) cost no new search.
+        Avoid-tile costs are ignored; distances are in plain steps.
+
+        If the goal tile itself is an obstacle (mine, tavern), its walkable
+        neighbors are used as distance-zero seeds, matching the "adjacent"
+        goal handling of ``find``.
+
+        Args:
+            x1 (int): Goal position on the X axis.
+            y1 (int): Goal position on the Y axis.
+
+        Returns:
+            tuple: (dist, parent) arrays where ``dist`` holds the step count
+                to the goal (-1 for unreachable tiles) and ``parent`` holds
+                the flat index of the next tile toward the goal (-1 at the
+                goal itself).
+        """
+        field = self._field_cache.get((x1, y1))
+        if field is not None:
+            return field
+
+        size = self._map.size
+        obstacle_mask = self._obstacle_mask
+        dist = array("i", [-1]) * (size * size)
+        parent = array("i", [-1]) * (size * size)
+        queue = deque()
+
+        # Seed the search: the goal itself, or its walkable neighbors when
+        # the goal is an obstacle tile
+        goal = y1 * size + x1
+        if obstacle_mask[goal]:
+            for dx, dy in DIR_NEIGHBORS:
+                tx, ty = x1 + dx, y1 + dy
+                if -1 < tx < size and -1 < ty < size:
+                    idx = ty * size + tx
+                    if not obstacle_mask[idx]:
+                        dist[idx] = 0
+                        queue.append(idx)
+        else:
+            dist[goal] = 0
+            queue.append(goal)
+
+        # Flood outward; parent pointers lead back toward the goal
+        while queue:
+            idx = queue.popleft()
+            x = idx % size
+            y = idx // size
+            d = dist[idx] + 1
+            for dx, dy in DIR_NEIGHBORS:
+                tx, ty = x + dx, y + dy
+                if -1 < tx < size and -1 < ty < size:
+                    idx_ = ty * size + tx
+                    if not obstacle_mask[idx_] and dist[idx_] < 0:
+                        dist[idx_] = d
+                        parent[idx_] = idx
+                        queue.append(idx_)
+
+        field = (dist, parent)
+        self._field_cache[(x1, y1)] = field
+        return field
+
+    def __reset_buffers(self, x0, y0):
+        """Reset the reusable search buffers and seed them with the start.
+
+        Clears the node arrays and heap in place, bumps the closed-set
+        epoch (invalidating all previous stamps without touching the
+        array) and seeds node 0 with the start position. Searches are
+        therefore allocation-free but not reentrant.
+
+        Args:
+            x0 (int): Initial position on the X axis.
+            y0 (int): Initial position on the Y axis.
+
+        Returns:
+            tuple: (xs, ys, gs, parents, heap) ready for a new search.
+        """
+        xs = self._xs
+        ys = self._ys
+        gs = self._gs
+        parents = self._parents
+        heap = self._heap
+        del xs[:]
+        del ys[:]
+        del gs[:]
+        del parents[:]
+        del heap[:]
+        xs.append(x0)
+        ys.append(y0)
+        gs.append(0)
+        parents.append(-1)
+        self._epoch += 1
+        return xs, ys, gs, parents, heap
+
+    def __search_bfs(self, x0, y0, x1, y1):
+        """Breadth-first search fast path for uniform movement costs.
+
+        Used by ``find`` when ``cost_avoid == cost_move``, in which case
+        the cached goal field from ``all_paths_to`` already encodes optimal
+        paths (including adjacent-goal handling) and the query is a plain
+        parent-pointer walk.
 
+        Args:
+            x0 (int): Initial position on the X axis.
+            y0 (int): Initial position on the Y axis.
+            x1 (int): Goal position on the X axis.
+            y1 (int): Goal position on the Y axis.
+
+        Returns:
+            list: A list of (x, y) tuples representing the path, or None if
+                no path is found.
+        """
+        size = self._map.size
+        dist, parent = self.all_paths_to(x1, y1)
+
+        if dist[y0 * size + x0] < 0:
+            return None
+
+        # The parent chain already runs start -> goal, so the walk emits
+        # positions in path order with no reversal needed
+        result = []
+        node = parent[y0 * size + x0]
+        while node != -1:
+            result.append((node % size, node // size))
+            node = parent[node]
         return result
 
-    def __neighbors(self, x, y, visited):
-        """Get the valid neighbors of a tile.
+    def __build_path(self, xs, ys, parents, node):
+        """Rebuild the path by walking the parent chain from a goal node.
 
         Args:
-            x (int): Current X position.
-            y (int): Current Y position.
-            visited (list): List of already visited positions.
+            xs (array): Node X coordinates, indexed by node id.
+            ys (array): Node Y coordinates, indexed by node id.
+            parents (array): Parent node ids (-1 for the start node).
+            node (int): The goal node id.
 
-        Yields:
-            tuple: (x, y) coordinates of valid neighboring tiles.
+        Returns:
+            list: A list of (x, y) tuples, excluding the start position.
         """
-        m = self._map
-        s = m.size
-        for dx, dy in DIR_NEIGHBORS:
-            tx, ty = x + dx, y + dy
-
-            if not (-1 < tx < s and -1 < ty < s):
-                continue
-
-            tile = m[tx, ty]
-            if tile not in self.obstacle_tiles and (tx, ty) not in visited:
-                visited.append((tx, ty))
-                yield tx, ty
+        # Walk the chain backward and reverse once (O(n)) instead of
+        # inserting at the front (O(n) per step). The start node
+        # (parent == -1) is excluded from the path.
+        result = []
+        while parents[node] != -1:
+            result.append((xs[node], ys[node]))
+            node = parents[node]
+        result.reverse()
+
+        return result
@@ -7,6 +7,8 @@ evaluation, and sorting.
 
 import random
 
+from .simulation import HERO_X, HERO_Y, HERO_LIFE
+
 MOVES = {
     # 'Stay'  : (0, 0),
     "North": (0, -1),
@@ -15,6 +17,37 @@ MOVES = {
     "East": (1, 0),
 }
 
+# Per-position legal move tables, keyed by board size. Board bounds are
+# static, so the bounds arithmetic is done once per size instead of per
+# generated node.
+_MOVE_TABLES = {}
+
+
+def _move_table(size):
+    """Get (building if needed) the legal move table for a board size.
+
+    Args:
+        size (int): The board size.
+
+    Returns:
+        list: For each flat position ``y*size + x``, a tuple of the move
+            commands that stay on the board.
+    """
+    table = _MOVE_TABLES.get(size)
+    if table is None:
+        table = []
+        for y in range(size):
+            for x in range(size):
+                table.append(
+                    tuple(
+                        move
+                        for move, (dx, dy) in MOVES.items()
+                        if -1 < x + dx < size and -1 < y + dy < size
+                    )
+                )
+        _MOVE_TABLES[size] = table
+    return table
+
 
 def terminal(minimax, game, state):
     """Check if a given state is terminal.
@@ -31,7 +64,10 @@ def terminal(minimax, game, state):
 
 
 def generate(minimax, game, state):
-    """Generate the children states of a given state.
+    """Generate the legal moves of a given state.
+
+    The moves are applied lazily by the search through ``State.make``/
+    ``State.unmake``, so no state copies are created here.
 
     Args:
         minimax (Minimax): The minimax instance.
@@ -39,23 +75,12 @@ def generate(minimax, game, state):
         state (State): The current state.
 
     Returns:
-        list: List of child states.
+        tuple: The legal move commands.
     """
     id = state.turn % 4
     hero = state.heroes[id]
-    x = hero["x"]
-    y = hero["y"]
     size = game.map.size
-
-    result = []
-    for move, dir in MOVES.items():
-        x_, y_ = x + dir[0], y + dir[1]
-        if not (-1 < x_ < size and -1 < y_ < size):
-            continue
-        s = state.clone()
-        s.simulate(move)
-        result.append(s)
-    return result
+    return _move_table(size)[hero[HERO_Y] * size + hero[HERO_X]]
 
 
 def evaluate(minimax, game, state):
@@ -71,38 +96,41 @@ def evaluate(minimax, game, state):
     """
     id = (game.turn % 4) + 1
     hero = state.heroes[id - 1]
+    hx = hero[HERO_X]
+    hy = hero[HERO_Y]
 
     value = 0
     distance = None
     for (x, y), owner in state.mines.items():
-        mod = 1 if (owner == id) else -1
-
-        # mine ownership
-        value += 0 if owner is None else mod * 1000
-
-        # mine distance
-        if mod != 1:
-            d = abs(hero["x"] - x) + abs(hero["y"] - y)
+        if owner == id:
+            # mine ownership
+            value += 1000
+        else:
+            if owner is not None:
+                value -= 1000
+
+            # mine distance
+            d = abs(hx - x) + abs(hy - y)
             if distance is None or d < distance:
                 distance = d
 
     value -= distance or 0
 
     # life
-    value += round(hero["life"] / 10)
+    value += round(hero[HERO_LIFE] / 10)
 
     return value
 
 
-def sort(minimax, game, states):
-    """Sort the state children.
+def sort(minimax, game, moves):
+    """Sort the generated moves.
 
     Args:
         minimax (Minimax): The minimax instance.
         game (Game): The game instance.
-        states (list): List of states to sort.
+        moves (list): List of moves to sort.
 
     Returns:
-        list: Sorted list of states.
+        list: Sorted list of moves.
     """
-    return reversed(states)
+    return reversed(moves)
@@ -11,6 +11,11 @@ from . import functions as f
 
 __all__ = ["Minimax"]
 
+# Transposition table entry flags
+_TT_EXACT = 0
+_TT_LOWER = 1
+_TT_UPPER = 2
+
 
 class Minimax:
     """Minimax algorithm with alpha-beta pruning.
@@ -41,8 +46,8 @@ class Minimax:
             max_depth (int): Maximum depth of the algorithm. Defaults to 5.
             f_terminal (function): Function to verify if a state is terminal.
             f_evaluate (function): Function to evaluate the value of a state.
-            f_generate (function): Function to generate a state's children.
-            f_sort (function): Function to sort the state children list.
+            f_generate (function): Function to generate a state's legal moves.
+            f_sort (function): Function to sort the generated move list.
         """
         self.game = game
         self.max_depth = max_depth
@@ -50,6 +55,11 @@ class Minimax:
         self._f_evaluate = f_evaluate
         self._f_generate = f_generate
         self._f_sort = f_sort
+        # Transposition table: zhash -> (depth, value, flag, best_move),
+        # cleared at the start of every search
+        self._tt = {}
+        # Killer moves: depth -> move that last caused a beta cutoff there
+        self._killers = {}
 
     def find(self):
         """Find the best move using minimax search.
@@ -58,12 +68,13 @@ class Minimax:
             list: A list of next expected commands (from your bot and the enemies).
         """
         state = State(self.game)
-        value, state = self._minimax(state, self.max_depth)
+        self._tt.clear()
+        self._killers.clear()
+        value, move = self._minimax(state, self.max_depth)
         result = []
 
-        while state.last_move:
-            result.append(state.last_move)
-            state = state.parent
+        if move:
+            result.append(move)
 
         return result
 
@@ -78,33 +89,74 @@ class Minimax:
             color (int): Current player color/turn.
 
         Returns:
-            tuple: (best_value, best_state) tuple.
+            tuple: (best_value, best_move) tuple.
         """
-        state._value = 0
         game = self.game
         mod = 1 if color % 4 == 0 else -1
 
         if depth == 0 or self._f_terminal(self, game, state):
-            return (mod * self._f_evaluate(self, game, state), state)
+            return (mod * self._f_evaluate(self, game, state), None)
+
+        # Transposition table probe: states reached through different move
+        # orders hash alike, so a previous search of the same state at the
+        # same depth can narrow the window or answer outright
+        alpha_orig = alpha
+        entry = self._tt.get(state.zhash)
+        if entry is not None and entry[0] == depth:
+            _, tt_value, tt_flag, tt_move = entry
+            if tt_flag == _TT_EXACT:
+                return (tt_value, tt_move)
+            elif tt_flag == _TT_LOWER:
+                alpha = max(alpha, tt_value)
+            else:
+                beta = min(beta, tt_value)
+            if alpha >= beta:
+                return (tt_value, tt_move)
 
         best_value = -float("inf")
-        best_state = None
-        next_states = self._f_generate(self, game, state)
-        next_states = self._f_sort(self, game, next_states)
-
-        for next_state in next_states:
-            value, state_ = self._minimax(
-                next_state, depth - 1, -beta, -alpha, color + 1
-            )
+        best_move = None
+        moves = self._f_generate(self, game, state)
+        moves = list(self._f_sort(self, game, moves))
+
+        # Move ordering: try the table's best move first (principal
+        # variation), then the move that last caused a cutoff at this depth
+        # (killer move) - good ordering maximizes alpha-beta cutoffs
+        tt_move = entry[3] if entry is not None else None
+        for preferred in (self._killers.get(depth), tt_move):
+            if preferred is not None and preferred in moves:
+                moves.remove(preferred)
+                moves.insert(0, preferred)
+
+        # Apply each move in place and roll it back afterwards, instead of
+        # cloning and simulating a new state per child
+        for move in moves:
+            undo = state.make(move)
+            value, _ = self._minimax(state, depth - 1, -beta, -alpha, color + 1)
+            state.unmake(undo)
             if color % 4 == 0 or (color + 1) % 4 == 0:
                 value = -value
 
-            if (value > best_value) or (value == best_state and random.random() < 0.3):
-                best_state = next_state
+            # Random tiebreak only at the root, to vary play between equal
+            # moves without paying for random() in the whole tree
+            if (value > best_value) or (
+                color == 0 and value == best_value and random.random() < 0.3
+            ):
+                best_move = move
                 best_value = value
 
             alpha = max(alpha, value)
             if alpha >= beta:
+                self._killers[depth] = move
                 break
 
-        return (best_value, best_state)
+        # Transposition table store, flagged by how the value relates to
+        # the original alpha-beta window
+        if best_value <= alpha_orig:
+            flag = _TT_UPPER
+        elif best_value >= beta:
+            flag = _TT_LOWER
+        else:
+            flag = _TT_EXACT
+        self._tt[state.zhash] = (depth, best_value, flag, best_move)
+
+        return (best_value, best_move)
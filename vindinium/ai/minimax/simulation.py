@@ -1,17 +1,33 @@
 """Game simulation functions for minimax algorithm.
 
 This module provides functions to simulate game moves and their effects
-on the game state.
+on the game state. Mutations can optionally be recorded into a journal
+so that a move can be undone again (see ``State.make``/``State.unmake``).
+
+Heroes are stored as flat lists indexed by the ``HERO_*`` constants below
+instead of dicts, so field access is a plain list index and copies are
+cheap positional copies.
 """
 
+# Field indices within a per-hero list
+HERO_X = 0
+HERO_Y = 1
+HERO_GOLD = 2
+HERO_MINE_COUNT = 3
+HERO_LIFE = 4
+HERO_SPAWN_X = 5
+HERO_SPAWN_Y = 6
+
 
-def kill(state, id, killer=None):
+def kill(state, id, killer=None, journal=None):
     """Recursively kill a hero and handle respawn.
 
     Args:
         state (State): The game state.
         id (int): The ID of the hero to kill.
         killer (int): The ID of the killer hero (optional).
+        journal (list): Optional journal recording (entry, old_value) pairs
+            for every mutation, used to undo the move later.
     """
     hero = state.heroes[id]
 
@@ -19,29 +35,37 @@ def kill(state, id, killer=None):
         if h == hero:
             continue
 
-        if h["x"] == hero["spawn_x"] and h["y"] == hero["spawn_y"]:
-            kill(state, i)
+        if h[HERO_X] == hero[HERO_SPAWN_X] and h[HERO_Y] == hero[HERO_SPAWN_Y]:
+            kill(state, i, journal=journal)
 
-    hero["x"] = hero["spawn_x"]
-    hero["y"] = hero["spawn_y"]
-    hero["mine_count"] = 0
-    hero["life"] = 100
+    _set_hero(state, id, HERO_X, hero[HERO_SPAWN_X], journal)
+    _set_hero(state, id, HERO_Y, hero[HERO_SPAWN_Y], journal)
+    _set_hero(state, id, HERO_MINE_COUNT, 0, journal)
+    _set_hero(state, id, HERO_LIFE, 100, journal)
 
     for pos, value in state.mines.items():
         if value == id + 1:
             if killer is None:
-                state.mines[pos] = None
+                _set_mine(state, pos, None, journal)
             else:
-                state.mines[pos] = killer + 1
-                state.heroes[killer]["mine_count"] += 1
+                _set_mine(state, pos, killer + 1, journal)
+                _set_hero(
+                    state,
+                    killer,
+                    HERO_MINE_COUNT,
+                    state.heroes[killer][HERO_MINE_COUNT] + 1,
+                    journal,
+                )
 
 
-def simulate(state, move):
+def simulate(state, move, journal=None):
     """Simulate a movement in Vindinium given a minimax state.
 
     Args:
         state (State): A minimax state instance.
         move (str): The next movement ('North', 'South', 'East', 'West', 'Stay').
+        journal (list): Optional journal recording every mutation so the
+            move can be undone again via ``State.unmake``.
     """
     id = state.turn % 4
     hero = state.heroes[id]
@@ -57,11 +81,11 @@ def simulate(state, move):
         dir = (1, 0)
     elif move == "Stay":
         dir = (0, 0)
-    x_, y_ = hero["x"] + dir[0], hero["y"] + dir[1]
+    x_, y_ = hero[HERO_X] + dir[0], hero[HERO_Y] + dir[1]
     hero_ = None
 
     for h in state.heroes:
-        if h["x"] == x_ and h["y"] == y_:
+        if h[HERO_X] == x_ and h[HERO_Y] == y_:
             hero_ = h
             break
 
@@ -70,14 +94,14 @@ def simulate(state, move):
 
     if tile == 0 and not hero_:
         # EMPTY
-        hero["x"] = x_
-        hero["y"] = y_
+        _set_hero(state, id, HERO_X, x_, journal)
+        _set_hero(state, id, HERO_Y, y_, journal)
 
     elif tile == 3:
         # TAVERN
-        if hero["gold"] > 2:
-            hero["gold"] -= 2
-            hero["life"] = min(hero["life"] + 50, 100)
+        if hero[HERO_GOLD] > 2:
+            _set_hero(state, id, HERO_GOLD, hero[HERO_GOLD] - 2, journal)
+            _set_hero(state, id, HERO_LIFE, min(hero[HERO_LIFE] + 50, 100), journal)
 
     elif tile == 4:
         # MINE
@@ -86,19 +110,25 @@ def simulate(state, move):
         # hero is not the mine's owner
         if mine != id + 1:
             # get mine
-            if hero["life"] > 20:
-                hero["life"] -= 20
-                hero["mine_count"] += 1
+            if hero[HERO_LIFE] > 20:
+                _set_hero(state, id, HERO_LIFE, hero[HERO_LIFE] - 20, journal)
+                _set_hero(state, id, HERO_MINE_COUNT, hero[HERO_MINE_COUNT] + 1, journal)
 
                 # remove mine from previous owner
                 if mine is not None:
-                    state.heroes[mine - 1]["mine_count"] -= 1
+                    _set_hero(
+                        state,
+                        mine - 1,
+                        HERO_MINE_COUNT,
+                        state.heroes[mine - 1][HERO_MINE_COUNT] - 1,
+                        journal,
+                    )
 
-                state.mines[x_, y_] = id + 1
+                _set_mine(state, (x_, y_), id + 1, journal)
 
             # dies trying
             else:
-                kill(state, id)
+                kill(state, id, journal=journal)
 
     # Fight
     for i, h in enumerate(state.heroes):
@@ -106,17 +136,47 @@ def simulate(state, move):
             continue
 
         # Attack if 1-tile distance
-        if abs(hero["x"] - h["x"]) + abs(hero["y"] - h["y"]) == 1:
-            if h["life"] > 20:
-                h["life"] -= 20
+        if abs(hero[HERO_X] - h[HERO_X]) + abs(hero[HERO_Y] - h[HERO_Y]) == 1:
+            if h[HERO_LIFE] > 20:
+                _set_hero(state, i, HERO_LIFE, h[HERO_LIFE] - 20, journal)
 
             else:
-                kill(state, i, id)
+                kill(state, i, id, journal=journal)
 
     # Mining
-    hero["gold"] += hero["mine_count"]
+    _set_hero(state, id, HERO_GOLD, hero[HERO_GOLD] + hero[HERO_MINE_COUNT], journal)
 
     # Thirst
-    hero["life"] = max(hero["life"] - 1, 1)
+    _set_hero(state, id, HERO_LIFE, max(hero[HERO_LIFE] - 1, 1), journal)
 
     state.turn += 1
+
+
+def _set_hero(state, id, key, value, journal):
+    """Set a hero attribute, recording the old value in the journal.
+
+    Args:
+        state (State): The game state.
+        id (int): Index of the hero to mutate.
+        key (int): The hero field index (one of the ``HERO_*`` constants).
+        value: The new value.
+        journal (list): The journal list, or None to skip recording.
+    """
+    hero = state.heroes[id]
+    if journal is not None:
+        journal.append((hero, key, hero[key]))
+    hero[key] = value
+
+
+def _set_mine(state, pos, owner, journal):
+    """Set a mine owner, recording the old owner in the journal.
+
+    Args:
+        state (State): The game state.
+        pos (tuple): The (x, y) position of the mine.
+        owner (int): The new owner ID (1-based) or None.
+        journal (list): The journal list, or None to skip recording.
+    """
+    if journal is not None:
+        journal.append((state.mines, pos, state.mines[pos]))
+    state.mines[pos] = owner
@@ -4,7 +4,35 @@ This module provides the State class which represents a game state
 for use in minimax tree search.
 """
 
+import random
+
 from . import simulation
+from .simulation import (
+    HERO_X,
+    HERO_Y,
+    HERO_GOLD,
+    HERO_MINE_COUNT,
+    HERO_LIFE,
+)
+
+# Lazily allocated Zobrist keys: one random 64-bit value per unique
+# (feature, ...) tuple, so the tables adapt to any board size
+_ZKEYS = {}
+
+
+def _zkey(*key):
+    """Get (allocating if needed) the Zobrist key for a state feature.
+
+    Args:
+        *key: A hashable feature description, e.g. ``("hx", hero_idx, x)``.
+
+    Returns:
+        int: A random 64-bit value, stable for the lifetime of the process.
+    """
+    value = _ZKEYS.get(key)
+    if value is None:
+        value = _ZKEYS[key] = random.getrandbits(64)
+    return value
 
 
 class State:
@@ -17,8 +45,13 @@ class State:
         last_move (str): The last move that led to this state.
         parent (State): The parent state.
         turn (int): The current turn number.
-        heroes (list): List of hero dictionaries.
+        heroes (list): List of flat hero lists, indexed by the ``HERO_*``
+            constants from ``vindinium.ai.minimax.simulation``.
         mines (dict): Dictionary mapping (x, y) positions to owner IDs.
+        zhash (int): Zobrist hash over hero positions, life, gold and
+            mine counts, mine ownership and the moving hero (turn modulo
+            4), maintained incrementally by ``make``/``unmake`` for
+            transposition table lookups.
     """
 
     def __init__(self, game=None):
@@ -35,6 +68,7 @@ class State:
             self.turn = game.turn
             self.heroes = [h.copy() for h in game.heroes]
             self.mines = game.mines.copy()
+            self.zhash = game.zhash
         else:
             self.last_move = None
             self.parent = None
@@ -43,24 +77,48 @@ class State:
             self.heroes = []
             self.mines = {}
             self._populate()
+            self.zhash = self._compute_zhash()
 
     def _populate(self):
         """Populate the state from the game instance."""
         for hero in self._game.heroes:
-            h = dict(
-                x=hero.x,
-                y=hero.y,
-                gold=hero.gold,
-                mine_count=hero.mine_count,
-                life=hero.life,
-                spawn_x=hero.spawn_x,
-                spawn_y=hero.spawn_y,
-            )
+            # Field order matches the HERO_* index constants
+            h = [
+                hero.x,
+                hero.y,
+                hero.gold,
+                hero.mine_count,
+                hero.life,
+                hero.spawn_x,
+                hero.spawn_y,
+            ]
             self.heroes.append(h)
 
         for mine in self._game.mines:
             self.mines[(mine.x, mine.y)] = mine.owner
 
+    def _compute_zhash(self):
+        """Compute the Zobrist hash of this state from scratch.
+
+        Every field the evaluation reads is hashed: positions, life, gold
+        and mine counts, plus mine owners and turn % 4. Leaving any of
+        them out lets distinct states (e.g. a heal line and a wall-bump
+        line reaching the same squares) collide in the transposition
+        table and return each other's scores.
+
+        Returns:
+            int: The hash over hero state, mine owners and turn % 4.
+        """
+        z = _zkey("t", self.turn % 4)
+        for i, hero in enumerate(self.heroes):
+            z ^= _zkey("hx", i, hero[HERO_X]) ^ _zkey("hy", i, hero[HERO_Y])
+            z ^= _zkey("hl", i, hero[HERO_LIFE])
+            z ^= _zkey("hg", i, hero[HERO_GOLD])
+            z ^= _zkey("hm", i, hero[HERO_MINE_COUNT])
+        for pos, owner in self.mines.items():
+            z ^= _zkey("m", pos, owner)
+        return z
+
     def clone(self):
         """Create a copy of this state.
 
@@ -77,6 +135,89 @@ class State:
         """
         self.last_move = move
         simulation.simulate(self, move)
+        self.zhash = self._compute_zhash()
+
+    def make(self, move):
+        """Apply a move in place, returning an undo record.
+
+        Unlike ``clone`` + ``simulate``, this mutates the state directly and
+        only records the values it overwrites, so the minimax search can
+        explore a move and roll it back without copying heroes and mines
+        at every node.
+
+        Args:
+            move (str): The move to apply ('North', 'South', 'East', 'West', 'Stay').
+
+        Returns:
+            tuple: An opaque undo record to pass to ``unmake``.
+        """
+        journal = []
+        undo = (self.last_move, self.zhash, journal)
+        self.last_move = move
+        simulation.simulate(self, move, journal)
+        self._update_zhash(journal)
+        return undo
+
+    def unmake(self, undo):
+        """Undo a move previously applied with ``make``.
+
+        Args:
+            undo (tuple): The undo record returned by ``make``.
+        """
+        last_move, zhash, journal = undo
+        # Replay the journal backward, restoring each overwritten value
+        for container, key, value in reversed(journal):
+            container[key] = value
+        self.turn -= 1
+        self.last_move = last_move
+        self.zhash = zhash
+
+    def _update_zhash(self, journal):
+        """Update the Zobrist hash incrementally after a simulated move.
+
+        Mirrors ``_compute_zhash``: hero positions, life, gold and mine
+        counts, mine owners and turn % 4. Fields written more than once
+        in a single move (e.g. a position reset by a kill) are collapsed
+        to their first-old/final-new pair before hashing.
+
+        Args:
+            journal (list): The mutation journal recorded by ``make``.
+        """
+        z = self.zhash
+        z ^= _zkey("t", (self.turn - 1) % 4) ^ _zkey("t", self.turn % 4)
+
+        mines = self.mines
+        # Hero lists can be equal by value, so map them back by identity
+        hero_index = {id(h): i for i, h in enumerate(self.heroes)}
+        first_old = {}
+        for container, key, old in journal:
+            entry = (id(container), key)
+            if entry not in first_old:
+                first_old[entry] = (container, key, old)
+
+        for container, key, old in first_old.values():
+            new = container[key]
+            if new == old:
+                continue
+            if container is mines:
+                z ^= _zkey("m", key, old) ^ _zkey("m", key, new)
+            elif key == HERO_X:
+                i = hero_index[id(container)]
+                z ^= _zkey("hx", i, old) ^ _zkey("hx", i, new)
+            elif key == HERO_Y:
+                i = hero_index[id(container)]
+                z ^= _zkey("hy", i, old) ^ _zkey("hy", i, new)
+            elif key == HERO_LIFE:
+                i = hero_index[id(container)]
+                z ^= _zkey("hl", i, old) ^ _zkey("hl", i, new)
+            elif key == HERO_GOLD:
+                i = hero_index[id(container)]
+                z ^= _zkey("hg", i, old) ^ _zkey("hg", i, new)
+            elif key == HERO_MINE_COUNT:
+                i = hero_index[id(container)]
+                z ^= _zkey("hm", i, old) ^ _zkey("hm", i, new)
+
+        self.zhash = z
 
     def __str__(self):
         """Return a string representation of the state.
@@ -88,11 +229,11 @@ class State:
         for i, hero in enumerate(self.heroes):
             s += "    %d: (%d, %d, l%03d, $%d, m%d)\n" % (
                 i,
-                hero["x"],
-                hero["y"],
-                hero["life"],
-                hero["gold"],
-                hero["mine_count"],
+                hero[HERO_X],
+                hero[HERO_Y],
+                hero[HERO_LIFE],
+                hero[HERO_GOLD],
+                hero[HERO_MINE_COUNT],
             )
 
         return s
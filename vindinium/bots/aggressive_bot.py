@@ -11,6 +11,21 @@ from vindinium.ai import AStar
 
 __all__ = ["AggressiveBot"]
 
+# All five commands; a module-level tuple so the random fallback
+# indexes a constant instead of building a list per call
+_MOVES = ("Stay", "North", "West", "East", "South")
+
+# Command by single-step delta. One dict lookup
+# replaces the branch ladder behind vin.utils.path_to_command on the
+# per-turn output path.
+_CMD = {
+    (0, -1): "North",
+    (0, 1): "South",
+    (-1, 0): "West",
+    (1, 0): "East",
+    (0, 0): "Stay",
+}
+
 
 class AggressiveBot(BaseBot):
     """Bot that aggressively attacks other heroes.
@@ -39,27 +54,24 @@ class AggressiveBot(BaseBot):
         Returns:
             str: The direction to move ('North', 'South', 'East', 'West', 'Stay').
         """
-        print(self.hero.life)
-        self.target = self._get_best_target()
-        distance = vin.utils.distance_manhattan(
-            self.hero.x, self.hero.y, self.target.x, self.target.y
-        )
-        in_spawn = (
-            self.target.x == self.target.spawn_x
-            and self.target.y == self.target.spawn_y
-        )
-
-        if self.hero.life <= 40 and self.hero.gold > 2:
+        hero = self.hero
+        target = self.target = self._get_best_target()
+        # Manhattan distance inlined; the helper call isn't worth the
+        # function and attribute-lookup overhead on the per-turn path
+        distance = abs(hero.x - target.x) + abs(hero.y - target.y)
+        in_spawn = target.x == target.spawn_x and target.y == target.spawn_y
+
+        if hero.life <= 40 and hero.gold > 2:
             return self._go_to_nearest_tavern()
 
         elif distance < 5 and not in_spawn:
-            return self._go_to(self.target.x, self.target.y)
+            return self._go_to(target.x, target.y)
 
-        elif self.hero.life <= 60 and self.hero.gold > 2:
+        elif hero.life <= 60 and hero.gold > 2:
             return self._go_to_nearest_tavern()
 
         else:
-            return self._go_to(self.target.x, self.target.y)
+            return self._go_to(target.x, target.y)
 
     def _get_best_target(self):
         """Select the best hero to target.
@@ -89,13 +101,17 @@ class AggressiveBot(BaseBot):
         x = self.hero.x
         y = self.hero.y
 
-        # Order taverns by distance
-        taverns = vin.utils.order_by_distance(x, y, self.game.taverns)
-        for tavern in taverns:
-            command = self._go_to(tavern.x, tavern.y)
-
-            if command:
-                return command
+        # One shared-frontier search over all taverns at once; Manhattan
+        # ordering with a full A* per candidate wastes searches when the
+        # closest-looking tavern is walled off
+        result = self.search.find_nearest(
+            x, y, [(tavern.x, tavern.y) for tavern in self.game.taverns]
+        )
+        if result is not None:
+            (x_, y_), path = result
+            if path:
+                x_, y_ = path[0]
+            return _CMD[(x_ - x, y_ - y)]
 
         return self._random()
 
@@ -112,6 +128,12 @@ class AggressiveBot(BaseBot):
         x = self.hero.x
         y = self.hero.y
 
+        # Fast path: an adjacent (or current) target needs no search, the
+        # command is fully determined by the single-step delta - the same
+        # answer A* gives via its adjacent-goal handling
+        if abs(x_ - x) + abs(y_ - y) <= 1:
+            return _CMD[(x_ - x, y_ - y)]
+
         # Compute path to the target
         path = self.search.find(x, y, x_, y_)
 
@@ -122,7 +144,7 @@ class AggressiveBot(BaseBot):
         if len(path) > 0:
             x_, y_ = path[0]
 
-        return vin.utils.path_to_command(x, y, x_, y_)
+        return _CMD[(x_ - x, y_ - y)]
 
     def _random(self):
         """Return a random move.
@@ -130,4 +152,4 @@ class AggressiveBot(BaseBot):
         Returns:
             str: A randomly chosen direction.
         """
-        return random.choice(["Stay", "North", "West", "East", "South"])
+        return _MOVES[random.randrange(5)]
@@ -12,6 +12,31 @@ from vindinium.ai import AStar
 
 __all__ = ["CharmingMoleBot"]
 
+# All five commands; a module-level tuple so the random fallback
+# indexes a constant instead of building a list per call
+_MOVES = ("Stay", "North", "West", "East", "South")
+
+# Position deltas per move command; a single dict lookup replaces the
+# chain of string comparisons in the per-turn position checks
+_DELTA = {
+    "North": (0, -1),
+    "South": (0, 1),
+    "West": (-1, 0),
+    "East": (1, 0),
+    "Stay": (0, 0),
+}
+
+# Command by single-step delta; the inverse of _DELTA. One dict lookup
+# replaces the branch ladder behind vin.utils.path_to_command on the
+# per-turn output path.
+_CMD = {
+    (0, -1): "North",
+    (0, 1): "South",
+    (-1, 0): "West",
+    (1, 0): "East",
+    (0, 0): "Stay",
+}
+
 
 class CharmingMoleBot(BaseBot):
     """A survival-focused mining bot with configurable aggression levels.
@@ -198,7 +223,11 @@ class CharmingMoleBot(BaseBot):
     # =========================================================================
 
     search = None
-    _friendly_hero_ids = None  # Cache of friendly hero IDs
+    _friendly_mask = 0         # Bitmask of friendly hero IDs (bit id-1 set)
+    _friendly_heroes = None    # Cache of friendly Hero objects
+    _has_friends = False       # True when any friendly hero is in the game
+    _friendly_pos = None       # Per-turn snapshot of friendly (x, y, id)
+    _enemy_candidates = None   # Cache of non-self, non-friendly Hero objects
     _prev_life = None          # Track previous life for respawn detection
 
     def _do_start(self):
@@ -218,20 +247,33 @@ class CharmingMoleBot(BaseBot):
         multiple instances of the same bot may be matched together.
 
         Note: This should be called at game start. Hero names don't change
-        during a game, so we only need to compute this once.
+        during a game, so we only need to compute this once. The Hero
+        objects are updated in place by ``Game.update``, so the friendly
+        and enemy partitions cached here stay valid for the whole game
+        and the per-turn checks don't have to re-filter all heroes.
         """
-        if not self.FRIENDLY_FIRE_AVOIDANCE:
-            self._friendly_hero_ids = set()
-            return
+        self._friendly_mask = 0
+        self._friendly_heroes = []
+        self._enemy_candidates = []
 
         # Determine the name to match against
-        match_name = self.friendly_name if self.friendly_name else self.hero.name
+        if self.FRIENDLY_FIRE_AVOIDANCE:
+            match_name = self.friendly_name if self.friendly_name else self.hero.name
+        else:
+            match_name = None
 
-        # Find all heroes with the same name (excluding ourselves)
-        self._friendly_hero_ids = set()
+        # Partition the other heroes into friendlies (same name) and
+        # enemy candidates
         for hero in self.game.heroes:
-            if hero.id != self.hero.id and hero.name == match_name:
-                self._friendly_hero_ids.add(hero.id)
+            if hero.id == self.hero.id:
+                continue
+            if match_name is not None and hero.name == match_name:
+                self._friendly_mask |= 1 << (hero.id - 1)
+                self._friendly_heroes.append(hero)
+            else:
+                self._enemy_candidates.append(hero)
+
+        self._has_friends = bool(self._friendly_heroes)
 
     def _is_friendly_hero(self, hero_id):
         """Check if a hero is friendly (same team/name).
@@ -242,11 +284,9 @@ class CharmingMoleBot(BaseBot):
         Returns:
             bool: True if the hero is friendly and should not be attacked.
         """
-        if not self.FRIENDLY_FIRE_AVOIDANCE:
-            return False
-        if self._friendly_hero_ids is None:
-            return False
-        return hero_id in self._friendly_hero_ids
+        # With at most 4 heroes the friendly set fits in an int bitmask;
+        # the mask is 0 when avoidance is disabled, so no extra guard
+        return bool((self._friendly_mask >> (hero_id - 1)) & 1)
 
     def _is_friendly_mine(self, mine):
         """Check if a mine is owned by a friendly hero.
@@ -270,16 +310,8 @@ class CharmingMoleBot(BaseBot):
         Returns:
             tuple: (x, y) coordinates after the move.
         """
-        x, y = self.hero.x, self.hero.y
-        if command == "North":
-            return (x, y - 1)
-        elif command == "South":
-            return (x, y + 1)
-        elif command == "West":
-            return (x - 1, y)
-        elif command == "East":
-            return (x + 1, y)
-        return (x, y)  # Stay
+        dx, dy = _DELTA.get(command, (0, 0))
+        return (self.hero.x + dx, self.hero.y + dy)
 
     def _would_hit_friendly(self, command):
         """Check if executing a move would result in attacking a friendly hero.
@@ -302,28 +334,31 @@ class CharmingMoleBot(BaseBot):
             bool: True if we should yield (stay) to avoid hitting a friendly hero.
                   False if we should proceed with the move.
         """
-        if not self.FRIENDLY_FIRE_AVOIDANCE:
+        if not self.FRIENDLY_FIRE_AVOIDANCE or not self._friendly_heroes:
             return False
 
+        me = self.hero
         next_x, next_y = self._get_position_after_move(command)
 
-        # Check if any friendly hero is at the target position
-        for hero in self.game.heroes:
-            if hero.id == self.hero.id:
-                continue
-            if self._is_friendly_hero(hero.id):
-                if hero.x == next_x and hero.y == next_y:
-                    # Critical HP exception: survival trumps friendly fire avoidance
-                    # If we're about to die, we must move even if it means hitting a friendly
-                    if self.hero.life < 25:
-                        return False  # Don't yield, move anyway
-
-                    # Deadlock prevention: use hero ID priority
-                    # Lower ID yields to higher ID, ensuring one always moves
-                    if self.hero.id < hero.id:
-                        return True   # We yield (stay)
-                    else:
-                        return False  # They should yield (we move)
+        # Check against the per-turn position snapshot (positions don't
+        # change between the checks within a single move decision)
+        friendly_pos = self._friendly_pos
+        if friendly_pos is None:
+            friendly_pos = [(h.x, h.y, h.id) for h in self._friendly_heroes]
+
+        for fx, fy, fid in friendly_pos:
+            if fx == next_x and fy == next_y:
+                # Critical HP exception: survival trumps friendly fire avoidance
+                # If we're about to die, we must move even if it means hitting a friendly
+                if me.life < 25:
+                    return False  # Don't yield, move anyway
+
+                # Deadlock prevention: use hero ID priority
+                # Lower ID yields to higher ID, ensuring one always moves
+                if me.id < fid:
+                    return True   # We yield (stay)
+                else:
+                    return False  # They should yield (we move)
         return False
 
     # =========================================================================
@@ -344,11 +379,7 @@ class CharmingMoleBot(BaseBot):
             list: List of enemy Hero objects.
         """
         enemies = []
-        for hero in self.game.heroes:
-            if hero.id == self.hero.id:
-                continue
-            if self._is_friendly_hero(hero.id):
-                continue
+        for hero in self._enemy_candidates:
             # Skip crashed enemies unless explicitly requested
             if not include_crashed and hero.crashed:
                 continue
@@ -366,11 +397,11 @@ class CharmingMoleBot(BaseBot):
         Returns:
             list: List of (enemy, distance) tuples, sorted by distance.
         """
+        hx = self.hero.x
+        hy = self.hero.y
         nearby = []
         for enemy in self._get_enemies():
-            dist = vin.utils.distance_manhattan(
-                self.hero.x, self.hero.y, enemy.x, enemy.y
-            )
+            dist = abs(hx - enemy.x) + abs(hy - enemy.y)
             if dist <= max_distance:
                 nearby.append((enemy, dist))
         return sorted(nearby, key=lambda x: x[1])
@@ -483,7 +514,7 @@ class CharmingMoleBot(BaseBot):
                 continue
 
             # Check friendly fire
-            if self._would_hit_friendly(direction):
+            if self._has_friends and self._would_hit_friendly(direction):
                 continue
 
             return direction
@@ -500,13 +531,12 @@ class CharmingMoleBot(BaseBot):
         Returns:
             bool: True if the tile is walkable (empty or spawn).
         """
-        try:
-            tile = self.game.map[x, y]
-            # TILE_EMPTY = 0, TILE_SPAWN = 5 are walkable
-            # TILE_WALL = 1, TILE_TAVERN = 3, TILE_MINE = 4 are not
-            return tile in (0, 5)  # Empty or spawn point
-        except (IndexError, KeyError):
+        size = self.game.map.size
+        if not (0 <= x < size and 0 <= y < size):
             return False  # Out of bounds
+        # Walls, taverns and mines block movement; spawn tiles are
+        # walkable (A* merely prices them as avoid tiles)
+        return self.game.map[x, y] not in vin.OBSTACLE_TILES
 
     def _would_hit_enemy(self, command):
         """Check if a move would walk into an enemy hero.
@@ -537,11 +567,10 @@ class CharmingMoleBot(BaseBot):
         Returns:
             Tavern: A neighboring tavern, or None if no tavern is next to us.
         """
+        hx = self.hero.x
+        hy = self.hero.y
         for tavern in self.game.taverns:
-            dist = vin.utils.distance_manhattan(
-                self.hero.x, self.hero.y, tavern.x, tavern.y
-            )
-            if dist == 1:
+            if abs(hx - tavern.x) + abs(hy - tavern.y) == 1:
                 return tavern
         return None
 
@@ -554,9 +583,7 @@ class CharmingMoleBot(BaseBot):
         Returns:
             str: Direction to move to reach the tavern.
         """
-        return vin.utils.path_to_command(
-            self.hero.x, self.hero.y, tavern.x, tavern.y
-        )
+        return _CMD[(tavern.x - self.hero.x, tavern.y - self.hero.y)]
 
     def _should_heal_at_nearby_tavern(self):
         """Determine if we should heal at a neighboring tavern.
@@ -684,9 +711,8 @@ class CharmingMoleBot(BaseBot):
             bool: True if the mine is worth taking.
         """
         # Calculate distance to mine
-        distance = vin.utils.distance_manhattan(
-            self.hero.x, self.hero.y, mine_x, mine_y
-        )
+        hero = self.hero
+        distance = abs(hero.x - mine_x) + abs(hero.y - mine_y)
 
         remaining = self._get_remaining_turns()
 
@@ -704,7 +730,7 @@ class CharmingMoleBot(BaseBot):
         # Check if we have enough HP to survive the journey + capture
         # Need: travel HP loss (1 per turn) + capture cost (20) + small buffer (5)
         hp_needed = distance + 20 + 5
-        if self.hero.life < hp_needed:
+        if hero.life < hp_needed:
             return False
 
         return True
@@ -729,11 +755,18 @@ class CharmingMoleBot(BaseBot):
         Returns:
             str: The direction to move ('North', 'South', 'East', 'West', 'Stay').
         """
+        hero = self.hero
+
+        # Snapshot friendly positions once per turn; the friendly-fire
+        # check may run several times while picking this move
+        if self._has_friends:
+            self._friendly_pos = [(h.x, h.y, h.id) for h in self._friendly_heroes]
+
         # Priority 1: Opportunistic healing at nearby tavern
         should_heal, tavern = self._should_heal_at_nearby_tavern()
         if should_heal:
             command = self._move_to_nearby_tavern(tavern)
-            self._prev_life = self.hero.life
+            self._prev_life = hero.life
             return command
 
         # Priority 2: Flee from critical danger (configurable threshold)
@@ -742,37 +775,37 @@ class CharmingMoleBot(BaseBot):
             # Try to flee
             flee_cmd = self._get_flee_direction(closest_enemy)
             if flee_cmd != "Stay":
-                self._prev_life = self.hero.life
+                self._prev_life = hero.life
                 return flee_cmd
             # Can't flee - go to tavern if possible
-            if self.hero.gold >= 2:
+            if hero.gold >= 2:
                 command = self._go_to_nearest_tavern()
-                self._prev_life = self.hero.life
+                self._prev_life = hero.life
                 return command
 
         # Priority 3: Go to tavern if low HP (phase-aware threshold)
         hp_threshold = self._get_dynamic_hp_threshold(danger_level)
 
-        if self.hero.life < hp_threshold and self.hero.gold >= 2:
+        if hero.life < hp_threshold and hero.gold >= 2:
             command = self._go_to_nearest_tavern()
         else:
             # Priority 4: Normal mining behavior (with mine value calculation)
             command = self._go_to_nearest_mine()
 
         # Safety check: don't walk into enemies (configurable)
-        if self.DANGER_CHECK_ENABLED and self.hero.life < self.DANGER_CHECK_HP_THRESHOLD:
+        if self.DANGER_CHECK_ENABLED and hero.life < self.DANGER_CHECK_HP_THRESHOLD:
             if self._would_walk_into_danger(command):
                 safe_cmd = self._find_safe_alternative(command)
                 if safe_cmd:
                     command = safe_cmd
 
         # Friendly fire avoidance
-        if self._would_hit_friendly(command):
-            self._prev_life = self.hero.life
+        if self._has_friends and self._would_hit_friendly(command):
+            self._prev_life = hero.life
             return "Stay"
 
         # Track life for respawn detection
-        self._prev_life = self.hero.life
+        self._prev_life = hero.life
         return command
 
     def _would_walk_into_danger(self, command):
@@ -788,24 +821,23 @@ class CharmingMoleBot(BaseBot):
         Returns:
             bool: True if the move is dangerous (would result in death).
         """
+        me = self.hero
         next_x, next_y = self._get_position_after_move(command)
 
         for enemy in self._get_enemies():
-            dist = vin.utils.distance_manhattan(next_x, next_y, enemy.x, enemy.y)
-
             # Would walk into enemy - only dangerous if we'd die
-            if dist == 0:
+            if enemy.x == next_x and enemy.y == next_y:
                 # We attack first (we're moving into them), dealing 20 damage
                 # Safe if: enemy dies (life <= 20)
                 if enemy.life <= 20:
                     return False  # Safe - we kill them
 
                 # Safe if: we have significantly more HP (we'd win the fight)
-                if self.hero.life > enemy.life:
+                if me.life > enemy.life:
                     return False  # Safe - we're stronger
 
                 # Dangerous only if we'd likely die
-                if self.hero.life <= 20:
+                if me.life <= 20:
                     return True  # We'd die on their counter-attack
 
         return False  # Not dangerous - go for it
@@ -829,7 +861,7 @@ class CharmingMoleBot(BaseBot):
                 continue
 
             if not self._would_walk_into_danger(direction):
-                if not self._would_hit_friendly(direction):
+                if not (self._has_friends and self._would_hit_friendly(direction)):
                     next_x, next_y = self._get_position_after_move(direction)
                     if self._is_tile_walkable(next_x, next_y):
                         return direction
@@ -858,9 +890,10 @@ class CharmingMoleBot(BaseBot):
         x = self.hero.x
         y = self.hero.y
 
-        # Order mines by distance
-        mines = vin.utils.order_by_distance(x, y, self.game.mines)
-        for mine in mines:
+        # Filter candidates once, then find the nearest reachable one with
+        # a single shared-frontier search instead of one A* run per mine
+        goals = []
+        for mine in self.game.mines:
             # Skip mines owned by this hero
             if mine.owner == self.hero.id:
                 continue
@@ -873,9 +906,14 @@ class CharmingMoleBot(BaseBot):
             if not self._is_mine_worth_taking(mine.x, mine.y):
                 continue
 
-            command = self._go_to(mine.x, mine.y)
-            if command:
-                return command
+            goals.append((mine.x, mine.y))
+
+        result = self.search.find_nearest(x, y, goals)
+        if result is not None:
+            (x_, y_), path = result
+            if path:
+                x_, y_ = path[0]
+            return _CMD[(x_ - x, y_ - y)]
 
         return self._random()
 
@@ -889,13 +927,15 @@ class CharmingMoleBot(BaseBot):
         x = self.hero.x
         y = self.hero.y
 
-        # Order taverns by distance
-        taverns = vin.utils.order_by_distance(x, y, self.game.taverns)
-        for tavern in taverns:
-            command = self._go_to(tavern.x, tavern.y)
-
-            if command:
-                return command
+        # One shared-frontier search over all taverns at once
+        result = self.search.find_nearest(
+            x, y, [(tavern.x, tavern.y) for tavern in self.game.taverns]
+        )
+        if result is not None:
+            (x_, y_), path = result
+            if path:
+                x_, y_ = path[0]
+            return _CMD[(x_ - x, y_ - y)]
 
         return self._random()
 
@@ -912,6 +952,12 @@ class CharmingMoleBot(BaseBot):
         x = self.hero.x
         y = self.hero.y
 
+        # Fast path: an adjacent (or current) target needs no search, the
+        # command is fully determined by the single-step delta - the same
+        # answer A* gives via its adjacent-goal handling
+        if abs(x_ - x) + abs(y_ - y) <= 1:
+            return _CMD[(x_ - x, y_ - y)]
+
         # Compute path to the target
         path = self.search.find(x, y, x_, y_)
 
@@ -922,7 +968,7 @@ class CharmingMoleBot(BaseBot):
         if len(path) > 0:
             x_, y_ = path[0]
 
-        return vin.utils.path_to_command(x, y, x_, y_)
+        return _CMD[(x_ - x, y_ - y)]
 
     def _random(self):
         """Return a random move.
@@ -930,4 +976,4 @@ class CharmingMoleBot(BaseBot):
         Returns:
             str: A randomly chosen direction.
         """
-        return random.choice(["Stay", "North", "West", "East", "South"])
+        return _MOVES[random.randrange(5)]
@@ -5,6 +5,7 @@ It can be tuned from very cautious (high survival, fewer mines) to aggressive
 (more mines, more deaths) using class attributes.
 """
 
+import heapq
 import random
 import vindinium as vin
 from vindinium.bots import BaseBot
@@ -12,6 +13,31 @@ from vindinium.ai import AStar
 
 __all__ = ["CharmingMoleBotV1"]
 
+# All five commands; a module-level tuple so the random fallback indexes
+# a constant instead of building a list per call
+_MOVES = ("Stay", "North", "West", "East", "South")
+
+# Command by single-step delta. One dict lookup
+# replaces the branch ladder behind vin.utils.path_to_command on the
+# per-turn output path.
+_CMD = {
+    (0, -1): "North",
+    (0, 1): "South",
+    (-1, 0): "West",
+    (1, 0): "East",
+    (0, 0): "Stay",
+}
+
+# Inverse table: single-step delta by command, for projecting where a
+# candidate move would land
+_MOVE_DELTAS = {
+    "North": (0, -1),
+    "South": (0, 1),
+    "West": (-1, 0),
+    "East": (1, 0),
+    "Stay": (0, 0),
+}
+
 
 class CharmingMoleBotV1(BaseBot):
     """A survival-focused mining bot with configurable aggression levels.
@@ -283,10 +309,22 @@ class CharmingMoleBotV1(BaseBot):
     # =========================================================================
 
     search = None
-    _friendly_hero_ids = None  # Cache of friendly hero IDs
+    _friendly_hero_ids = frozenset()  # Static set of friendly hero IDs
     _prev_life = None          # Track previous life for respawn detection
     _respawn_turn = None       # Turn when we last respawned
     _cached_destination = None # Cached destination (x, y) - cleared on respawn
+    _dist_enemies = None       # Per-turn hero-to-enemy Manhattan distances by id
+    _enemy_at_pos = None       # Per-turn (x, y) -> enemy Hero index
+    _path_cache = None         # Goal -> (origin, remaining path) A* results
+    _enemies_cache = None      # Per-turn cache of the live enemy list
+    _enemies_turn = -1         # Turn the enemy cache was built for
+    _phase_cache = None        # Per-turn cache of the game phase
+    _phase_turn = -1           # Turn the phase cache was built for
+    _remaining_cache = None    # Per-turn cache of remaining hero turns
+    _remaining_turn = -1       # Turn the remaining-turns cache was built for
+    _tavern_zone = frozenset() # Tiles on or next to a tavern, static per game
+    _region = None             # Connected-component label per tile, flat y*size+x
+    _map_size = 0              # Board size, cached for the flat region index
 
     def _do_start(self):
         """Initialize the A* pathfinding algorithm and internal state.
@@ -297,11 +335,56 @@ class CharmingMoleBotV1(BaseBot):
         - Respawn tracking state
         """
         self.search = AStar(self.game.map)
+        # Taverns never move, so "within one tile of any tavern" is a
+        # static set; the pub-fight scan tests membership instead of
+        # walking every tavern per enemy
+        zone = set()
+        for tavern in self.game.taverns:
+            tx, ty = tavern.x, tavern.y
+            zone.update(
+                ((tx, ty), (tx - 1, ty), (tx + 1, ty), (tx, ty - 1), (tx, ty + 1))
+            )
+        self._tavern_zone = frozenset(zone)
+        # Label the connected walkable regions once; goals in a different
+        # region can then be rejected in O(1) instead of letting A* flood
+        # the whole component before giving up
+        game_map = self.game.map
+        size = game_map.size
+        region = bytearray(size * size)
+        label = 0
+        for sy in range(size):
+            base = sy * size
+            for sx in range(size):
+                if region[base + sx] or game_map[sx, sy] in vin.OBSTACLE_TILES:
+                    continue
+                label += 1
+                region[base + sx] = label
+                stack = [(sx, sy)]
+                while stack:
+                    cx, cy = stack.pop()
+                    for nx, ny in ((cx - 1, cy), (cx + 1, cy),
+                                   (cx, cy - 1), (cx, cy + 1)):
+                        if 0 <= nx < size and 0 <= ny < size:
+                            idx = ny * size + nx
+                            if not region[idx] and \
+                                    game_map[nx, ny] not in vin.OBSTACLE_TILES:
+                                region[idx] = label
+                                stack.append((nx, ny))
+        self._region = region
+        self._map_size = size
+        self._snapshot_config()
         self._update_friendly_heroes()
         # Initialize respawn tracking
         self._prev_life = self.hero.life
         self._respawn_turn = None
         self._cached_destination = None
+        self._path_cache = {}
+        self._enemies_cache = None
+        self._enemies_turn = -1
+        self._phase_cache = None
+        self._phase_turn = -1
+        self._remaining_cache = None
+        self._remaining_turn = -1
 
     def _update_friendly_heroes(self):
         """Identify and cache friendly hero IDs based on name matching.
@@ -314,17 +397,48 @@ class CharmingMoleBotV1(BaseBot):
         during a game, so we only need to compute this once.
         """
         if not self.FRIENDLY_FIRE_AVOIDANCE:
-            self._friendly_hero_ids = set()
+            self._friendly_hero_ids = frozenset()
             return
 
         # Determine the name to match against
         match_name = self.friendly_name if self.friendly_name else self.hero.name
 
-        # Find all heroes with the same name (excluding ourselves)
-        self._friendly_hero_ids = set()
-        for hero in self.game.heroes:
-            if hero.id != self.hero.id and hero.name == match_name:
-                self._friendly_hero_ids.add(hero.id)
+        # Find all heroes with the same name (excluding ourselves);
+        # frozen because the roster never changes mid-game
+        self._friendly_hero_ids = frozenset(
+            hero.id for hero in self.game.heroes
+            if hero.id != self.hero.id and hero.name == match_name
+        )
+
+    def _snapshot_config(self):
+        """Copy the tuning class attributes onto the instance.
+
+        The hot predicates read these settings several times per turn, and
+        each class-attribute access walks the MRO. Snapshotting them once
+        at game start turns every read into a plain instance lookup.
+        Subclasses customize behavior by overriding the class attributes;
+        mutating them after the game has started has no effect.
+        """
+        self._ok_enabled = self.OPPORTUNISTIC_KILLS_ENABLED
+        self._ok_max_distance = self.OPPORTUNISTIC_KILL_MAX_DISTANCE
+        self._ok_enemy_hp_threshold = self.OPPORTUNISTIC_KILL_ENEMY_HP_THRESHOLD
+        self._ok_hp_advantage = self.OPPORTUNISTIC_KILL_HP_ADVANTAGE
+        self._ok_min_enemy_mines = self.OPPORTUNISTIC_KILL_MIN_ENEMY_MINES
+        self._ok_min_our_hp = self.OPPORTUNISTIC_KILL_MIN_OUR_HP
+        self._hp_thr_opening = self.HP_THRESHOLD_OPENING
+        self._hp_thr_mid = self.HP_THRESHOLD_MID
+        self._hp_thr_end = self.HP_THRESHOLD_END
+        self._danger_hp_modifier = self.DANGER_HP_MODIFIER
+        self._danger_check_enabled = self.DANGER_CHECK_ENABLED
+        self._danger_check_hp_threshold = self.DANGER_CHECK_HP_THRESHOLD
+        self._flee_danger_threshold = self.FLEE_DANGER_THRESHOLD
+        self._nearby_heal_threshold = self.NEARBY_TAVERN_HEAL_THRESHOLD
+        self._min_turns_to_hold_mine = self.MIN_TURNS_TO_HOLD_MINE
+        self._respawn_detection = self.RESPAWN_DETECTION_ENABLED
+        self._respawn_aggressive_turns = self.RESPAWN_AGGRESSIVE_TURNS
+        self._phase_opening_end = self.PHASE_OPENING_END
+        self._phase_mid_end = self.PHASE_MID_END
+        self._allow_stay_fallback = self.ALLOW_STAY_AS_FALLBACK
 
     def _is_friendly_hero(self, hero_id):
         """Check if a hero is friendly (same team/name).
@@ -335,10 +449,6 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             bool: True if the hero is friendly and should not be attacked.
         """
-        if not self.FRIENDLY_FIRE_AVOIDANCE:
-            return False
-        if self._friendly_hero_ids is None:
-            return False
         return hero_id in self._friendly_hero_ids
 
     def _is_friendly_mine(self, mine):
@@ -350,9 +460,8 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             bool: True if the mine is owned by a friendly hero.
         """
-        if mine.owner is None:
-            return False
-        return self._is_friendly_hero(mine.owner)
+        # Unowned mines have owner None, which is never in the ID set
+        return mine.owner in self._friendly_hero_ids
 
     def _get_position_after_move(self, command):
         """Calculate the position after executing a move command.
@@ -363,16 +472,8 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             tuple: (x, y) coordinates after the move.
         """
-        x, y = self.hero.x, self.hero.y
-        if command == "North":
-            return (x, y - 1)
-        elif command == "South":
-            return (x, y + 1)
-        elif command == "West":
-            return (x - 1, y)
-        elif command == "East":
-            return (x + 1, y)
-        return (x, y)  # Stay
+        dx, dy = _MOVE_DELTAS.get(command, (0, 0))
+        return (self.hero.x + dx, self.hero.y + dy)
 
     def _would_hit_friendly(self, command):
         """Check if executing a move would result in attacking a friendly hero.
@@ -436,6 +537,12 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             list: List of enemy Hero objects.
         """
+        # Hero state is fixed within one decision tick, so the common
+        # include_crashed=False list is built once per turn and shared by
+        # the distance table, danger, kill and safety paths
+        if not include_crashed and self._enemies_turn == self.game.turn:
+            return self._enemies_cache
+
         enemies = []
         for hero in self.game.heroes:
             if hero.id == self.hero.id:
@@ -446,6 +553,10 @@ class CharmingMoleBotV1(BaseBot):
             if not include_crashed and hero.crashed:
                 continue
             enemies.append(hero)
+
+        if not include_crashed:
+            self._enemies_cache = enemies
+            self._enemies_turn = self.game.turn
         return enemies
 
     def _get_nearby_enemies(self, max_distance=3):
@@ -460,10 +571,10 @@ class CharmingMoleBotV1(BaseBot):
             list: List of (enemy, distance) tuples, sorted by distance.
         """
         nearby = []
+        dist_cache = self._dist_enemies
         for enemy in self._get_enemies():
-            dist = vin.utils.distance_manhattan(
-                self.hero.x, self.hero.y, enemy.x, enemy.y
-            )
+            # Read the per-turn distance table built in _do_move
+            dist = dist_cache[enemy.id]
             if dist <= max_distance:
                 nearby.append((enemy, dist))
         return sorted(nearby, key=lambda x: x[1])
@@ -593,13 +704,14 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             bool: True if the tile is walkable (empty or spawn).
         """
-        try:
-            tile = self.game.map[x, y]
-            # TILE_EMPTY = 0, TILE_SPAWN = 5 are walkable
-            # TILE_WALL = 1, TILE_TAVERN = 3, TILE_MINE = 4 are not
-            return tile in (0, 5)  # Empty or spawn point
-        except (IndexError, KeyError):
+        size = self._map_size
+        if not (0 <= x < size and 0 <= y < size):
             return False  # Out of bounds
+        # Walls, taverns and mines block movement; spawn tiles are
+        # walkable (A* merely prices them as avoid tiles).  Same
+        # semantics as the flood-fill region labels and the minimax
+        # variant's walk mask.
+        return self.game.map[x, y] not in vin.OBSTACLE_TILES
 
     def _would_hit_enemy(self, command):
         """Check if a move would walk into an enemy hero.
@@ -610,12 +722,7 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             bool: True if the move would walk into an enemy.
         """
-        next_x, next_y = self._get_position_after_move(command)
-
-        for enemy in self._get_enemies():
-            if enemy.x == next_x and enemy.y == next_y:
-                return True
-        return False
+        return self._get_position_after_move(command) in self._enemy_at_pos
 
     # =========================================================================
     # PHASE 3: OPPORTUNISTIC KILLS - Hunt Weak Enemies
@@ -639,11 +746,11 @@ class CharmingMoleBotV1(BaseBot):
             bool: True if the enemy is worth killing.
         """
         # Check distance
-        if distance > self.OPPORTUNISTIC_KILL_MAX_DISTANCE:
+        if distance > self._ok_max_distance:
             return False
 
         # Check if we have enough HP
-        if self.hero.life < self.OPPORTUNISTIC_KILL_MIN_OUR_HP:
+        if self.hero.life < self._ok_min_our_hp:
             return False
 
         # Check if enemy is weak enough (absolute threshold)
@@ -651,20 +758,20 @@ class CharmingMoleBotV1(BaseBot):
             heuristics_modifier = 1
         else:
             heuristics_modifier = enemy.mine_count / 2
-        heuristics_threshold = heuristics_modifier * self.OPPORTUNISTIC_KILL_ENEMY_HP_THRESHOLD
+        heuristics_threshold = heuristics_modifier * self._ok_enemy_hp_threshold
         if enemy.life > heuristics_threshold:
             return False
 
         # Check HP advantage
-        if self.hero.life < enemy.life + self.OPPORTUNISTIC_KILL_HP_ADVANTAGE:
+        if self.hero.life < enemy.life + self._ok_hp_advantage:
             return False
 
         # Check if enemy has enough mines to be worth chasing
-        if enemy.mine_count < self.OPPORTUNISTIC_KILL_MIN_ENEMY_MINES:
+        if enemy.mine_count < self._ok_min_enemy_mines:
             return False
 
-        # Don't attack friendly bots
-        if self.FRIENDLY_FIRE_AVOIDANCE and enemy.id in self._friendly_hero_ids:
+        # Don't attack friendly bots (set is empty when avoidance is off)
+        if enemy.id in self._friendly_hero_ids:
             return False
 
         return True
@@ -678,15 +785,14 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             tuple: (enemy, distance) of best target, or (None, None) if no target.
         """
-        if not self.OPPORTUNISTIC_KILLS_ENABLED:
+        if not self._ok_enabled:
             return (None, None)
 
         candidates = []
+        dist_cache = self._dist_enemies
 
         for enemy in self._get_enemies():
-            distance = vin.utils.distance_manhattan(
-                self.hero.x, self.hero.y, enemy.x, enemy.y
-            )
+            distance = dist_cache[enemy.id]
 
             if self._is_enemy_worth_killing(enemy, distance):
                 # Score: prioritize by mines (desc), then low HP, then close distance
@@ -723,7 +829,7 @@ class CharmingMoleBotV1(BaseBot):
 
         if len(path) > 0:
             next_x, next_y = path[0]
-            return vin.utils.path_to_command(x, y, next_x, next_y)
+            return _CMD[(next_x - x, next_y - y)]
 
         return "Stay"
 
@@ -740,11 +846,10 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             Tavern: A neighboring tavern, or None if no tavern is next to us.
         """
+        hx = self.hero.x
+        hy = self.hero.y
         for tavern in self.game.taverns:
-            dist = vin.utils.distance_manhattan(
-                self.hero.x, self.hero.y, tavern.x, tavern.y
-            )
-            if dist == 1:
+            if abs(hx - tavern.x) + abs(hy - tavern.y) == 1:
                 return tavern
         return None
 
@@ -757,9 +862,7 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             str: Direction to move to reach the tavern.
         """
-        return vin.utils.path_to_command(
-            self.hero.x, self.hero.y, tavern.x, tavern.y
-        )
+        return _CMD[(tavern.x - self.hero.x, tavern.y - self.hero.y)]
 
     def _should_heal_at_nearby_tavern(self):
         """Determine if we should heal at a neighboring tavern.
@@ -786,7 +889,7 @@ class CharmingMoleBotV1(BaseBot):
             return (True, tavern)
 
         # Normal case: heal if HP < threshold (configurable via class attribute)
-        if self.hero.life < self.NEARBY_TAVERN_HEAL_THRESHOLD:
+        if self.hero.life < self._nearby_heal_threshold:
             return (True, tavern)
 
         return (False, None)
@@ -809,7 +912,7 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             bool: True if we just respawned, False otherwise.
         """
-        if not self.RESPAWN_DETECTION_ENABLED:
+        if not self._respawn_detection:
             return False
 
         # Detect respawn: previous life was very low, now at 100
@@ -824,6 +927,8 @@ class CharmingMoleBotV1(BaseBot):
             self._respawn_turn = self.game.turn
             # Clear cached destination - don't path to old target
             self._cached_destination = None
+            # Cached paths start from the tile we died on
+            self._path_cache.clear()
             return True
 
         return False
@@ -837,14 +942,14 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             bool: True if in post-respawn aggressive phase.
         """
-        if not self.RESPAWN_DETECTION_ENABLED:
+        if not self._respawn_detection:
             return False
 
         if self._respawn_turn is None:
             return False
 
         turns_since_respawn = self.game.turn - self._respawn_turn
-        return turns_since_respawn < self.RESPAWN_AGGRESSIVE_TURNS
+        return turns_since_respawn < self._respawn_aggressive_turns
 
     def _get_game_phase(self):
         """Determine the current game phase based on turn progress.
@@ -861,22 +966,28 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             str: "opening", "mid", or "end"
         """
-        # Calculate game progress
+        # Phase only depends on the turn counter and respawn state, both
+        # fixed within a tick, so compute it at most once per turn
         turn = self.game.turn
+        if self._phase_turn == turn:
+            return self._phase_cache
         max_turns = self.game.max_turns
         progress = turn / max_turns if max_turns > 0 else 0
 
         # Check if in post-respawn aggressive phase
         if self._is_in_post_respawn_phase():
-            return "opening"
-
+            phase = "opening"
         # Normal phase calculation
-        if progress < self.PHASE_OPENING_END:
-            return "opening"
-        elif progress < self.PHASE_MID_END:
-            return "mid"
+        elif progress < self._phase_opening_end:
+            phase = "opening"
+        elif progress < self._phase_mid_end:
+            phase = "mid"
         else:
-            return "end"
+            phase = "end"
+
+        self._phase_cache = phase
+        self._phase_turn = turn
+        return phase
 
     def _get_remaining_turns(self):
         """Get the number of turns remaining in the game.
@@ -887,9 +998,16 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             int: Remaining turns for this hero.
         """
-        total_remaining = self.game.max_turns - self.game.turn
+        turn = self.game.turn
+        if self._remaining_turn == turn:
+            return self._remaining_cache
+
+        total_remaining = self.game.max_turns - turn
         # Each hero gets 1/4 of total turns
-        return total_remaining // 4
+        remaining = total_remaining // 4
+        self._remaining_cache = remaining
+        self._remaining_turn = turn
+        return remaining
 
     def _get_dynamic_hp_threshold(self, danger_level=0):
         """Get the HP threshold for going to tavern based on game phase and danger.
@@ -907,14 +1025,14 @@ class CharmingMoleBotV1(BaseBot):
         phase = self._get_game_phase()
 
         if phase == "opening":
-            base_threshold = self.HP_THRESHOLD_OPENING
+            base_threshold = self._hp_thr_opening
         elif phase == "mid":
-            base_threshold = self.HP_THRESHOLD_MID
+            base_threshold = self._hp_thr_mid
         else:  # end
-            base_threshold = self.HP_THRESHOLD_END
+            base_threshold = self._hp_thr_end
 
         # Add danger modifier: more conservative when enemies nearby
-        danger_modifier = self.DANGER_HP_MODIFIER if danger_level >= 1 else 0
+        danger_modifier = self._danger_hp_modifier if danger_level >= 1 else 0
 
         return base_threshold + danger_modifier
 
@@ -935,10 +1053,8 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             bool: True if the mine is worth taking.
         """
-        # Calculate distance to mine
-        distance = vin.utils.distance_manhattan(
-            self.hero.x, self.hero.y, mine_x, mine_y
-        )
+        # Calculate distance to mine (inline; this runs per candidate mine)
+        distance = abs(self.hero.x - mine_x) + abs(self.hero.y - mine_y)
 
         remaining = self._get_remaining_turns()
 
@@ -950,7 +1066,7 @@ class CharmingMoleBotV1(BaseBot):
         turns_holding = remaining - distance
 
         # Not worth it if we'd hold for less than MIN_TURNS_TO_HOLD_MINE
-        if turns_holding < self.MIN_TURNS_TO_HOLD_MINE:
+        if turns_holding < self._min_turns_to_hold_mine:
             return False
 
         # Check if we have enough HP to survive the journey + capture
@@ -987,83 +1103,78 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             str: The direction to move ('North', 'South', 'East', 'West', 'Stay').
         """
-        # Priority 0: Check for respawn and reset strategy
-        self._check_and_handle_respawn()
-
-        # Priority 1: Opportunistic healing at nearby tavern
-        should_heal, tavern = self._should_heal_at_nearby_tavern()
-        if should_heal:
-            command = self._move_to_nearby_tavern(tavern)
-            self._prev_life = self.hero.life
-            return command
-
-        # Priority 2: Flee from critical danger OR pub fight stalemate
-        danger_level, closest_enemy = self._get_danger_level()
-
-        # Check for pub fight stalemate: we're adjacent to enemy who is near ANY tavern
-        is_pub_fight = False
-        if closest_enemy is not None:
-            enemy_dist = vin.utils.distance_manhattan(
-                self.hero.x, self.hero.y,
-                closest_enemy.x, closest_enemy.y
-            )
-            if enemy_dist == 1:  # We're fighting (adjacent to enemy)
-                # Check if enemy is near ANY tavern (they can just heal)
-                for tavern in self.game.taverns:
-                    tavern_to_enemy = vin.utils.distance_manhattan(
-                        tavern.x, tavern.y,
-                        closest_enemy.x, closest_enemy.y
-                    )
-                    if tavern_to_enemy <= 1:  # Enemy adjacent to tavern
-                        is_pub_fight = True
-                        break
-
-        if danger_level >= self.FLEE_DANGER_THRESHOLD or is_pub_fight:
-            # Try to flee
-            flee_cmd = self._get_flee_direction(closest_enemy)
-            if flee_cmd != "Stay":
-                self._prev_life = self.hero.life
-                return flee_cmd
-            # Can't flee - go to tavern if possible
-            if self.hero.gold >= 2:
-                command = self._go_to_nearest_tavern()
-                self._prev_life = self.hero.life
-                return command
-
-        # Priority 3: Go to tavern if low HP (phase-aware threshold)
-        hp_threshold = self._get_dynamic_hp_threshold(danger_level)
+        # Track life for respawn detection on every exit path; the finally
+        # runs on return, so the respawn check still sees last turn's value
+        try:
+            # Hero-to-enemy distances are read by the danger, pub-fight and
+            # kill logic below; compute them once for the whole tick, along
+            # with a position index for the walk-into-enemy checks
+            hx = self.hero.x
+            hy = self.hero.y
+            self._dist_enemies = {}
+            self._enemy_at_pos = {}
+            for enemy in self._get_enemies():
+                self._dist_enemies[enemy.id] = abs(hx - enemy.x) + abs(hy - enemy.y)
+                self._enemy_at_pos[(enemy.x, enemy.y)] = enemy
+
+            # Priority 0: Check for respawn and reset strategy
+            self._check_and_handle_respawn()
+
+            # Priority 1: Opportunistic healing at nearby tavern
+            should_heal, tavern = self._should_heal_at_nearby_tavern()
+            if should_heal:
+                return self._move_to_nearby_tavern(tavern)
+
+            # Priority 2: Flee from critical danger OR pub fight stalemate
+            danger_level, closest_enemy = self._get_danger_level()
+
+            # Check for pub fight stalemate: we're adjacent to enemy who is near ANY tavern
+            is_pub_fight = False
+            if closest_enemy is not None:
+                enemy_dist = self._dist_enemies[closest_enemy.id]
+                if enemy_dist == 1:  # We're fighting (adjacent to enemy)
+                    # Enemy within one tile of a tavern can just keep healing
+                    is_pub_fight = (closest_enemy.x, closest_enemy.y) in self._tavern_zone
+
+            if danger_level >= self._flee_danger_threshold or is_pub_fight:
+                # Try to flee
+                flee_cmd = self._get_flee_direction(closest_enemy)
+                if flee_cmd != "Stay":
+                    return flee_cmd
+                # Can't flee - go to tavern if possible
+                if self.hero.gold >= 2:
+                    return self._go_to_nearest_tavern()
+
+            # Priority 3: Go to tavern if low HP (phase-aware threshold)
+            hp_threshold = self._get_dynamic_hp_threshold(danger_level)
+
+            if self.hero.life < hp_threshold and self.hero.gold >= 2:
+                return self._go_to_nearest_tavern()
+
+            # Priority 4: Opportunistic kill - hunt weak enemies with mines
+            kill_target, kill_distance = self._find_opportunistic_kill_target()
+            if kill_target is not None:
+                command = self._go_to_enemy(kill_target)
+                if command != "Stay":
+                    return command
+
+            # Priority 5: Normal mining behavior (with mine value calculation)
+            command = self._go_to_nearest_mine()
+
+            # Safety check: don't walk into enemies (configurable)
+            if self._danger_check_enabled and self.hero.life < self._danger_check_hp_threshold:
+                if self._would_walk_into_danger(command):
+                    safe_cmd = self._find_safe_alternative(command)
+                    if safe_cmd:
+                        command = safe_cmd
+
+            # Friendly fire avoidance
+            if self._would_hit_friendly(command):
+                return "Stay"
 
-        if self.hero.life < hp_threshold and self.hero.gold >= 2:
-            command = self._go_to_nearest_tavern()
-            self._prev_life = self.hero.life
             return command
-
-        # Priority 4: Opportunistic kill - hunt weak enemies with mines
-        kill_target, kill_distance = self._find_opportunistic_kill_target()
-        if kill_target is not None:
-            command = self._go_to_enemy(kill_target)
+        finally:
             self._prev_life = self.hero.life
-            if command != "Stay":
-                return command
-
-        # Priority 5: Normal mining behavior (with mine value calculation)
-        command = self._go_to_nearest_mine()
-
-        # Safety check: don't walk into enemies (configurable)
-        if self.DANGER_CHECK_ENABLED and self.hero.life < self.DANGER_CHECK_HP_THRESHOLD:
-            if self._would_walk_into_danger(command):
-                safe_cmd = self._find_safe_alternative(command)
-                if safe_cmd:
-                    command = safe_cmd
-
-        # Friendly fire avoidance
-        if self._would_hit_friendly(command):
-            self._prev_life = self.hero.life
-            return "Stay"
-
-        # Track life for respawn detection
-        self._prev_life = self.hero.life
-        return command
 
     def _would_walk_into_danger(self, command):
         """Check if a move would put us in a dangerous position.
@@ -1078,25 +1189,22 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             bool: True if the move is dangerous (would result in death).
         """
-        next_x, next_y = self._get_position_after_move(command)
-
-        for enemy in self._get_enemies():
-            dist = vin.utils.distance_manhattan(next_x, next_y, enemy.x, enemy.y)
-
-            # Would walk into enemy - only dangerous if we'd die
-            if dist == 0:
-                # We attack first (we're moving into them), dealing 20 damage
-                # Safe if: enemy dies (life <= 20)
-                if enemy.life <= 20:
-                    return False  # Safe - we kill them
-
-                # Safe if: we have significantly more HP (we'd win the fight)
-                if self.hero.life > enemy.life:
-                    return False  # Safe - we're stronger
-
-                # Dangerous only if we'd likely die
-                if self.hero.life <= 20:
-                    return True  # We'd die on their counter-attack
+        # At most one hero stands on a tile, so the per-turn position
+        # index answers "would we walk into an enemy" in one lookup
+        enemy = self._enemy_at_pos.get(self._get_position_after_move(command))
+        if enemy is not None:
+            # We attack first (we're moving into them), dealing 20 damage
+            # Safe if: enemy dies (life <= 20)
+            if enemy.life <= 20:
+                return False  # Safe - we kill them
+
+            # Safe if: we have significantly more HP (we'd win the fight)
+            if self.hero.life > enemy.life:
+                return False  # Safe - we're stronger
+
+            # Dangerous only if we'd likely die
+            if self.hero.life <= 20:
+                return True  # We'd die on their counter-attack
 
         return False  # Not dangerous - go for it
 
@@ -1112,20 +1220,22 @@ class CharmingMoleBotV1(BaseBot):
             str: A safer alternative command, or original if ALLOW_STAY_AS_FALLBACK=False.
         """
         # Try all directions except the dangerous one (exclude Stay initially)
-        movement_directions = ["North", "South", "East", "West"]
-
-        for direction in movement_directions:
+        for direction in ("North", "South", "East", "West"):
             if direction == original_command:
                 continue
 
-            if not self._would_walk_into_danger(direction):
-                if not self._would_hit_friendly(direction):
-                    next_x, next_y = self._get_position_after_move(direction)
-                    if self._is_tile_walkable(next_x, next_y):
-                        return direction
+            # Walkability first: it is a plain board lookup and rejects
+            # blocked directions before the enemy scans run at all
+            next_x, next_y = self._get_position_after_move(direction)
+            if not self._is_tile_walkable(next_x, next_y):
+                continue
+            if self._would_walk_into_danger(direction):
+                continue
+            if not self._would_hit_friendly(direction):
+                return direction
 
         # No safe movement found
-        if self.ALLOW_STAY_AS_FALLBACK:
+        if self._allow_stay_fallback:
             return "Stay"
         else:
             # Return original command - be aggressive, don't stay still
@@ -1147,17 +1257,23 @@ class CharmingMoleBotV1(BaseBot):
         """
         x = self.hero.x
         y = self.hero.y
-
-        # Order mines by distance
-        mines = vin.utils.order_by_distance(x, y, self.game.mines)
-        for mine in mines:
-            # Skip mines owned by this hero
-            if mine.owner == self.hero.id:
-                continue
-
-            # Skip mines owned by friendly heroes (same name)
-            if self._is_friendly_mine(mine):
-                continue
+        my_id = self.hero.id
+
+        # Drop hopeless candidates (our own, friendly and unreachable
+        # mines) before building the heap, then pop nearest-first; we
+        # usually stop at the first worthwhile one, so a full sort of
+        # the survivors is wasted work
+        candidates = [
+            (abs(x - mine.x) + abs(y - mine.y), idx, mine)
+            for idx, mine in enumerate(self.game.mines)
+            if mine.owner != my_id
+            and not self._is_friendly_mine(mine)
+            and self._is_reachable(mine.x, mine.y)
+        ]
+        heapq.heapify(candidates)
+
+        while candidates:
+            mine = heapq.heappop(candidates)[2]
 
             # Phase 2: Skip mines that aren't worth taking
             if not self._is_mine_worth_taking(mine.x, mine.y):
@@ -1179,9 +1295,9 @@ class CharmingMoleBotV1(BaseBot):
         x = self.hero.x
         y = self.hero.y
 
-        # Order taverns by distance
-        taverns = vin.utils.order_by_distance(x, y, self.game.taverns)
-        for tavern in taverns:
+        # Iterate taverns nearest-first, lazily; the closest reachable one
+        # almost always wins, so sorting the rest is wasted work
+        for tavern in vin.utils.iter_by_distance(x, y, self.game.taverns):
             command = self._go_to(tavern.x, tavern.y)
 
             if command:
@@ -1189,6 +1305,38 @@ class CharmingMoleBotV1(BaseBot):
 
         return self._random()
 
+    def _is_reachable(self, x_, y_):
+        """Check whether a goal tile can be reached from our position.
+
+        Uses the connected-component labels built in _do_start. Walkable
+        goals must share our region label; obstacle goals (mines,
+        taverns) count as reachable when any walkable neighbor does,
+        since they are captured/used from an adjacent tile.
+
+        Args:
+            x_ (int): Target x coordinate.
+            y_ (int): Target y coordinate.
+
+        Returns:
+            bool: True if a path to (or next to) the goal can exist.
+        """
+        size = self._map_size
+        if not (0 <= x_ < size and 0 <= y_ < size):
+            return False
+
+        region = self._region
+        here = region[self.hero.y * size + self.hero.x]
+        label = region[y_ * size + x_]
+        if label:
+            return label == here
+
+        # Obstacle goal: reachable via any walkable 4-neighbor in our region
+        for nx, ny in ((x_ - 1, y_), (x_ + 1, y_), (x_, y_ - 1), (x_, y_ + 1)):
+            if 0 <= nx < size and 0 <= ny < size \
+                    and region[ny * size + nx] == here:
+                return True
+        return False
+
     def _go_to(self, x_, y_):
         """Calculate path to target and return the next move.
 
@@ -1198,10 +1346,40 @@ class CharmingMoleBotV1(BaseBot):
 
         Returns:
             str: The direction to move toward the target, or None if no path exists.
+
+        The walkable layout never changes mid-game (walls, taverns and
+        mines are static obstacles regardless of owner), so a computed
+        path stays valid. Each result is cached by goal: a repeated query
+        from the same tile is answered directly, and when the hero
+        followed the route last turn the cached path is advanced one step
+        instead of re-running A*.
         """
         x = self.hero.x
         y = self.hero.y
 
+        key = (x_, y_)
+        entry = self._path_cache.get(key)
+        if entry is not None:
+            origin, path = entry
+            if origin == (x, y) and path:
+                # Same query repeated this tick
+                nx, ny = path[0]
+                return _CMD[(nx - x, ny - y)]
+            if path and path[0] == (x, y):
+                # We advanced one step along the cached route; keep following
+                del path[0]
+                if path:
+                    self._path_cache[key] = ((x, y), path)
+                    nx, ny = path[0]
+                    return _CMD[(nx - x, ny - y)]
+            # Stale (we deviated) or exhausted; fall through to a fresh search
+            del self._path_cache[key]
+
+        # A separated goal would make A* flood our whole region before
+        # failing; the precomputed labels answer that instantly
+        if not self._is_reachable(x_, y_):
+            return None
+
         # Compute path to the target
         path = self.search.find(x, y, x_, y_)
 
@@ -1209,10 +1387,11 @@ class CharmingMoleBotV1(BaseBot):
         if path is None:
             return None
 
+        self._path_cache[key] = ((x, y), path)
         if len(path) > 0:
             x_, y_ = path[0]
 
-        return vin.utils.path_to_command(x, y, x_, y_)
+        return _CMD[(x_ - x, y_ - y)]
 
     def _random(self):
         """Return a random move.
@@ -1220,4 +1399,4 @@ class CharmingMoleBotV1(BaseBot):
         Returns:
             str: A randomly chosen direction.
         """
-        return random.choice(["Stay", "North", "West", "East", "South"])
+        return _MOVES[random.randrange(5)]
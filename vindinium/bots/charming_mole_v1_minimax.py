@@ -12,6 +12,40 @@ from vindinium.ai import AStar
 
 __all__ = ["CharmingMoleBotV1Minimax"]
 
+# Position delta by command. A dict lookup replaces the string-compare
+# ladder on a path hit several times per turn by the collision and flee
+# checks; unknown commands fall back to staying put.
+_MOVE_DELTAS = {
+    "North": (0, -1),
+    "South": (0, 1),
+    "West": (-1, 0),
+    "East": (1, 0),
+    "Stay": (0, 0),
+}
+
+# The six possible flee orderings, as named constants shared by the
+# dispatch tables below. Static tuples, so picking an ordering never
+# allocates on the flee path.
+_FLEE_EAST_FIRST = ("East", "North", "South", "West")
+_FLEE_WEST_FIRST = ("West", "North", "South", "East")
+_FLEE_NORTH_SOUTH = ("North", "South", "East", "West")
+_FLEE_SOUTH_FIRST = ("South", "East", "West", "North")
+_FLEE_NORTH_FIRST = ("North", "East", "West", "South")
+_FLEE_EAST_WEST = ("East", "West", "North", "South")
+
+# Flee orderings keyed by the sign of the hero-minus-enemy offset on the
+# dominant axis; picking one is a single dict lookup.
+_FLEE_HORIZONTAL = {
+    1: _FLEE_EAST_FIRST,
+    -1: _FLEE_WEST_FIRST,
+    0: _FLEE_NORTH_SOUTH,
+}
+_FLEE_VERTICAL = {
+    1: _FLEE_SOUTH_FIRST,
+    -1: _FLEE_NORTH_FIRST,
+    0: _FLEE_EAST_WEST,
+}
+
 
 class CharmingMoleBotV1Minimax(BaseBot):
     """A survival-focused mining bot with configurable aggression levels.
@@ -283,10 +317,25 @@ class CharmingMoleBotV1Minimax(BaseBot):
     # =========================================================================
 
     search = None
-    _friendly_hero_ids = None  # Cache of friendly hero IDs
+    _tavern_by_neighbor = None # (x, y) -> adjacent Tavern, static per game
+    _walk_mask = None          # Flat bytearray, 1 where the tile is walkable
+    _map_size = 0              # Board size, cached for the bounds checks
+    _friendly_mask = 0         # Bitmask of friendly hero IDs (bit 1 << id)
+    _ff_active = False         # Friendly fire avoidance enabled AND friendlies exist
     _prev_life = None          # Track previous life for respawn detection
     _respawn_turn = None       # Turn when we last respawned
     _cached_destination = None # Cached destination (x, y) - cleared on respawn
+    _enemies_cache = None      # Per-turn cache of the live enemy list
+    _enemies_turn = -1         # Turn the enemy cache was built for
+    _path_cache = None         # A* results keyed by (x, y, goal_x, goal_y)
+    _mine_fingerprint = None   # Mine ownership snapshot guarding _path_cache
+    _turn_paths = None         # Paths computed this turn, keyed by goal
+    _hero_by_pos = None        # Per-turn (x, y) -> other-hero occupancy index
+    _enemy_tiles = frozenset() # Per-turn tiles occupied by live enemies
+    _danger_cache = None       # Per-turn (enemy id, distance) -> dangerous?
+    _safe_turn = False         # True when no live enemy is within 3 tiles
+    # Instance-level snapshots of the tuning class attributes (_ok_*,
+    # _hp_thr_*, _danger_* and friends) are assigned in _snapshot_config
 
     def _do_start(self):
         """Initialize the A* pathfinding algorithm and internal state.
@@ -297,11 +346,41 @@ class CharmingMoleBotV1Minimax(BaseBot):
         - Respawn tracking state
         """
         self.search = AStar(self.game.map)
+        # Precompute a flat walkability mask so per-tile checks are an
+        # index into a bytearray instead of a board lookup guarded by
+        # exception handling; the static map never changes mid-game
+        game_map = self.game.map
+        size = self._map_size = game_map.size
+        self._walk_mask = walk_mask = bytearray(size * size)
+        for ty in range(size):
+            base = ty * size
+            for tx in range(size):
+                walk_mask[base + tx] = game_map[tx, ty] not in vin.OBSTACLE_TILES
+        # Taverns never move; index every tile adjacent to one so the
+        # per-turn "tavern next to us?" question is a single dict lookup
+        # on the hero's position
+        self._tavern_by_neighbor = neighbors = {}
+        for tavern in self.game.taverns:
+            tx, ty = tavern.x, tavern.y
+            for nx, ny in ((tx - 1, ty), (tx + 1, ty), (tx, ty - 1), (tx, ty + 1)):
+                neighbors.setdefault((nx, ny), tavern)
         self._update_friendly_heroes()
+        self._snapshot_config()
         # Initialize respawn tracking
         self._prev_life = self.hero.life
         self._respawn_turn = None
         self._cached_destination = None
+        self._enemies_cache = None
+        self._enemies_turn = -1
+        self._path_cache = {}
+        self._mine_fingerprint = None
+        self._turn_paths = {}
+        self._danger_cache = {}
+        self._hero_by_pos = {
+            (hero.x, hero.y): hero
+            for hero in self.game.heroes
+            if hero.id != self.hero.id
+        }
 
     def _update_friendly_heroes(self):
         """Identify and cache friendly hero IDs based on name matching.
@@ -314,17 +393,48 @@ class CharmingMoleBotV1Minimax(BaseBot):
         during a game, so we only need to compute this once.
         """
         if not self.FRIENDLY_FIRE_AVOIDANCE:
-            self._friendly_hero_ids = set()
+            self._friendly_mask = 0
+            self._ff_active = False
             return
 
         # Determine the name to match against
         match_name = self.friendly_name if self.friendly_name else self.hero.name
 
-        # Find all heroes with the same name (excluding ourselves)
-        self._friendly_hero_ids = set()
+        # Hero IDs are 1-4, so the friendly set packs into an int; the
+        # membership test becomes one shift-and-mask with no hashing
+        mask = 0
         for hero in self.game.heroes:
             if hero.id != self.hero.id and hero.name == match_name:
-                self._friendly_hero_ids.add(hero.id)
+                mask |= 1 << hero.id
+        self._friendly_mask = mask
+        # Hot paths test this single flag instead of re-checking the class
+        # switch and the mask emptiness on every call
+        self._ff_active = bool(mask)
+
+    def _snapshot_config(self):
+        """Copy the tuning class attributes onto the instance.
+
+        The hot predicates read these settings several times per turn, and
+        each class-attribute access walks the MRO. Snapshotting them once
+        at game start turns every read into a plain instance lookup.
+        Subclasses customize behavior by overriding the class attributes;
+        mutating them after the game has started has no effect.
+        """
+        self._ok_enabled = self.OPPORTUNISTIC_KILLS_ENABLED
+        self._ok_max_distance = self.OPPORTUNISTIC_KILL_MAX_DISTANCE
+        self._ok_enemy_hp_threshold = self.OPPORTUNISTIC_KILL_ENEMY_HP_THRESHOLD
+        self._ok_hp_advantage = self.OPPORTUNISTIC_KILL_HP_ADVANTAGE
+        self._ok_min_enemy_mines = self.OPPORTUNISTIC_KILL_MIN_ENEMY_MINES
+        self._ok_min_our_hp = self.OPPORTUNISTIC_KILL_MIN_OUR_HP
+        self._hp_thr_opening = self.HP_THRESHOLD_OPENING
+        self._hp_thr_mid = self.HP_THRESHOLD_MID
+        self._hp_thr_end = self.HP_THRESHOLD_END
+        self._danger_hp_modifier = self.DANGER_HP_MODIFIER
+        self._danger_check_enabled = self.DANGER_CHECK_ENABLED
+        self._danger_check_hp_threshold = self.DANGER_CHECK_HP_THRESHOLD
+        self._flee_danger_threshold = self.FLEE_DANGER_THRESHOLD
+        self._nearby_heal_threshold = self.NEARBY_TAVERN_HEAL_THRESHOLD
+        self._min_turns_to_hold_mine = self.MIN_TURNS_TO_HOLD_MINE
 
     def _is_friendly_hero(self, hero_id):
         """Check if a hero is friendly (same team/name).
@@ -335,11 +445,7 @@ class CharmingMoleBotV1Minimax(BaseBot):
         Returns:
             bool: True if the hero is friendly and should not be attacked.
         """
-        if not self.FRIENDLY_FIRE_AVOIDANCE:
-            return False
-        if self._friendly_hero_ids is None:
-            return False
-        return hero_id in self._friendly_hero_ids
+        return bool(self._friendly_mask & (1 << hero_id))
 
     def _is_friendly_mine(self, mine):
         """Check if a mine is owned by a friendly hero.
@@ -363,16 +469,8 @@ class CharmingMoleBotV1Minimax(BaseBot):
         Returns:
             tuple: (x, y) coordinates after the move.
         """
-        x, y = self.hero.x, self.hero.y
-        if command == "North":
-            return (x, y - 1)
-        elif command == "South":
-            return (x, y + 1)
-        elif command == "West":
-            return (x - 1, y)
-        elif command == "East":
-            return (x + 1, y)
-        return (x, y)  # Stay
+        dx, dy = _MOVE_DELTAS.get(command, (0, 0))
+        return (self.hero.x + dx, self.hero.y + dy)
 
     def _would_hit_friendly(self, command):
         """Check if executing a move would result in attacking a friendly hero.
@@ -385,7 +483,8 @@ class CharmingMoleBotV1Minimax(BaseBot):
         and ensures heroes can reach taverns when critically low on health.
 
         Performance: This check is O(3) - iterates over max 3 other heroes with
-        O(1) set lookup for friendly check. Total overhead is ~0.001ms, negligible.
+        an O(1) bit test for the friendly check. Total overhead is ~0.001ms,
+        negligible.
         Safe to call every turn.
 
         Args:
@@ -395,29 +494,37 @@ class CharmingMoleBotV1Minimax(BaseBot):
             bool: True if we should yield (stay) to avoid hitting a friendly hero.
                   False if we should proceed with the move.
         """
-        if not self.FRIENDLY_FIRE_AVOIDANCE:
+        return self._would_hit_friendly_at(*self._get_position_after_move(command))
+
+    def _would_hit_friendly_at(self, next_x, next_y):
+        """Coordinate-taking variant of _would_hit_friendly.
+
+        Callers that already computed the destination tile pass it
+        directly instead of paying for another command-to-delta lookup.
+
+        Args:
+            next_x (int): X coordinate of the destination tile.
+            next_y (int): Y coordinate of the destination tile.
+
+        Returns:
+            bool: True if we should yield (stay) to avoid hitting a friendly hero.
+        """
+        if not self._ff_active:
             return False
 
-        next_x, next_y = self._get_position_after_move(command)
+        # Check if a friendly hero occupies the target position
+        hero = self._hero_by_pos.get((next_x, next_y))
+        if hero is None or not (self._friendly_mask & (1 << hero.id)):
+            return False
 
-        # Check if any friendly hero is at the target position
-        for hero in self.game.heroes:
-            if hero.id == self.hero.id:
-                continue
-            if self._is_friendly_hero(hero.id):
-                if hero.x == next_x and hero.y == next_y:
-                    # Critical HP exception: survival trumps friendly fire avoidance
-                    # If we're about to die, we must move even if it means hitting a friendly
-                    if self.hero.life < 25:
-                        return False  # Don't yield, move anyway
-
-                    # Deadlock prevention: use hero ID priority
-                    # Lower ID yields to higher ID, ensuring one always moves
-                    if self.hero.id < hero.id:
-                        return True   # We yield (stay)
-                    else:
-                        return False  # They should yield (we move)
-        return False
+        # Critical HP exception: survival trumps friendly fire avoidance
+        # If we're about to die, we must move even if it means hitting a friendly
+        if self.hero.life < 25:
+            return False  # Don't yield, move anyway
+
+        # Deadlock prevention: use hero ID priority
+        # Lower ID yields to higher ID, ensuring one always moves
+        return self.hero.id < hero.id
 
     # =========================================================================
     # PHASE 1: SURVIVAL - Enemy Awareness & Danger Detection
@@ -436,17 +543,45 @@ class CharmingMoleBotV1Minimax(BaseBot):
         Returns:
             list: List of enemy Hero objects.
         """
-        enemies = []
+        # Hero state only changes between turns, so the common
+        # include_crashed=False list is rebuilt at most once per turn and
+        # shared by the survival, kill and flee paths
+        if not include_crashed and self._enemies_turn == self.game.turn:
+            return self._enemies_cache
+
+        enemies = list(self._iter_enemies(include_crashed))
+
+        if not include_crashed:
+            self._enemies_cache = enemies
+            self._enemies_turn = self.game.turn
+        return enemies
+
+    def _iter_enemies(self, include_crashed=False):
+        """Yield enemy heroes lazily.
+
+        Single-use callers that stop at the first match can short-circuit
+        without materializing a list; _get_enemies builds its cached list
+        from this same filter so the two stay in sync.
+
+        Args:
+            include_crashed (bool): If True, include crashed/frozen enemies.
+
+        Yields:
+            Hero: The next enemy hero.
+        """
+        my_id = self.hero.id
+        friendly_mask = self._friendly_mask
         for hero in self.game.heroes:
-            if hero.id == self.hero.id:
+            if hero.id == my_id:
                 continue
-            if self._is_friendly_hero(hero.id):
+            # Membership test inlined; a method call per hero is measurable
+            # on this path
+            if friendly_mask & (1 << hero.id):
                 continue
             # Skip crashed enemies unless explicitly requested
             if not include_crashed and hero.crashed:
                 continue
-            enemies.append(hero)
-        return enemies
+            yield hero
 
     def _get_nearby_enemies(self, max_distance=3):
         """Get enemies within a certain Manhattan distance.
@@ -460,10 +595,11 @@ class CharmingMoleBotV1Minimax(BaseBot):
             list: List of (enemy, distance) tuples, sorted by distance.
         """
         nearby = []
+        hx = self.hero.x
+        hy = self.hero.y
         for enemy in self._get_enemies():
-            dist = vin.utils.distance_manhattan(
-                self.hero.x, self.hero.y, enemy.x, enemy.y
-            )
+            # Distance inlined; a helper call per enemy is pure overhead here
+            dist = abs(hx - enemy.x) + abs(hy - enemy.y)
             if dist <= max_distance:
                 nearby.append((enemy, dist))
         return sorted(nearby, key=lambda x: x[1])
@@ -483,22 +619,28 @@ class CharmingMoleBotV1Minimax(BaseBot):
         Returns:
             bool: True if the enemy poses a significant threat.
         """
+        # The verdict depends only on both HP values and the distance, all
+        # fixed within a decision tick, so repeated queries from the danger
+        # and flee logic hit a per-turn memo
+        key = (enemy.id, distance)
+        cached = self._danger_cache.get(key)
+        if cached is not None:
+            return cached
+
+        dangerous = False
         # If enemy is next to us (distance=1), they can attack us next turn
         if distance == 1:
-            # Enemy can kill us if our HP <= 20
-            if self.hero.life <= 20:
-                return True
-            # Enemy is dangerous if they have more HP (they'd win a fight)
-            if enemy.life >= self.hero.life:
-                return True
+            # Enemy can kill us if our HP <= 20, and they are dangerous if
+            # they have more HP (they'd win a fight)
+            dangerous = self.hero.life <= 20 or enemy.life >= self.hero.life
 
         # If enemy is 2 tiles away, they could reach us next turn
         elif distance == 2:
             # Only dangerous if we're low HP and they're healthy
-            if self.hero.life <= 40 and enemy.life > self.hero.life:
-                return True
+            dangerous = self.hero.life <= 40 and enemy.life > self.hero.life
 
-        return False
+        self._danger_cache[key] = dangerous
+        return dangerous
 
     def _get_danger_level(self):
         """Calculate overall danger level based on nearby enemies.
@@ -508,6 +650,11 @@ class CharmingMoleBotV1Minimax(BaseBot):
                 - danger_level: 0=safe, 1=caution, 2=danger, 3=critical
                 - closest_enemy: The nearest enemy Hero or None
         """
+        # Fast path: the turn-start distance pass already proved nobody
+        # is within 3 tiles
+        if self._safe_turn:
+            return (0, None)
+
         nearby = self._get_nearby_enemies(max_distance=3)
 
         if not nearby:
@@ -544,24 +691,10 @@ class CharmingMoleBotV1Minimax(BaseBot):
         dy = self.hero.y - enemy.y  # Positive = we're below enemy
 
         # Prioritize moving away in the axis with greater distance
-        flee_options = []
-
         if abs(dx) >= abs(dy):
-            # Prioritize horizontal flee
-            if dx > 0:
-                flee_options = ["East", "North", "South", "West"]
-            elif dx < 0:
-                flee_options = ["West", "North", "South", "East"]
-            else:
-                flee_options = ["North", "South", "East", "West"]
+            flee_options = _FLEE_HORIZONTAL[(dx > 0) - (dx < 0)]
         else:
-            # Prioritize vertical flee
-            if dy > 0:
-                flee_options = ["South", "East", "West", "North"]
-            elif dy < 0:
-                flee_options = ["North", "East", "West", "South"]
-            else:
-                flee_options = ["East", "West", "North", "South"]
+            flee_options = _FLEE_VERTICAL[(dy > 0) - (dy < 0)]
 
         # Try each flee direction, checking if it's safe
         for direction in flee_options:
@@ -571,18 +704,45 @@ class CharmingMoleBotV1Minimax(BaseBot):
             if not self._is_tile_walkable(next_x, next_y):
                 continue
 
-            # Check if we'd walk into another enemy
-            if self._would_hit_enemy(direction):
-                continue
-
-            # Check friendly fire
-            if self._would_hit_friendly(direction):
+            # Check enemies and friendly fire in one pass over the heroes
+            if self._classify_move_collision(next_x, next_y) is not None:
                 continue
 
             return direction
 
         return "Stay"  # No safe flee direction
 
+    def _classify_move_collision(self, next_x, next_y):
+        """Classify what stepping onto a tile would collide with.
+
+        Fuses the _would_hit_enemy and _would_hit_friendly checks into a
+        single pass over the heroes; the flee loop previously ran both,
+        each iterating the hero list on its own. Friendly collisions apply
+        the same yield rules as _would_hit_friendly (critical-HP exception,
+        lower ID yields).
+
+        Args:
+            next_x (int): X coordinate of the destination tile.
+            next_y (int): Y coordinate of the destination tile.
+
+        Returns:
+            str: "enemy" or "friendly" if the move collides with a hero we
+                should not run into, None if the tile is free to enter.
+        """
+        hero = self._hero_by_pos.get((next_x, next_y))
+        if hero is None:
+            return None
+        me = self.hero
+        if self._friendly_mask & (1 << hero.id):
+            # Critical HP exception: survival trumps friendly fire
+            if me.life < 25:
+                return None
+            # Lower ID yields to higher ID to break deadlocks
+            return "friendly" if me.id < hero.id else None
+        if not hero.crashed:
+            return "enemy"
+        return None
+
     def _is_tile_walkable(self, x, y):
         """Check if a tile can be walked on.
 
@@ -593,13 +753,10 @@ class CharmingMoleBotV1Minimax(BaseBot):
         Returns:
             bool: True if the tile is walkable (empty or spawn).
         """
-        try:
-            tile = self.game.map[x, y]
-            # TILE_EMPTY = 0, TILE_SPAWN = 5 are walkable
-            # TILE_WALL = 1, TILE_TAVERN = 3, TILE_MINE = 4 are not
-            return tile in (0, 5)  # Empty or spawn point
-        except (IndexError, KeyError):
-            return False  # Out of bounds
+        size = self._map_size
+        if 0 <= x < size and 0 <= y < size:
+            return bool(self._walk_mask[y * size + x])
+        return False  # Out of bounds
 
     def _would_hit_enemy(self, command):
         """Check if a move would walk into an enemy hero.
@@ -610,12 +767,7 @@ class CharmingMoleBotV1Minimax(BaseBot):
         Returns:
             bool: True if the move would walk into an enemy.
         """
-        next_x, next_y = self._get_position_after_move(command)
-
-        for enemy in self._get_enemies():
-            if enemy.x == next_x and enemy.y == next_y:
-                return True
-        return False
+        return self._get_position_after_move(command) in self._enemy_tiles
 
     # =========================================================================
     # PHASE 3: OPPORTUNISTIC KILLS - Hunt Weak Enemies
@@ -638,33 +790,40 @@ class CharmingMoleBotV1Minimax(BaseBot):
         Returns:
             bool: True if the enemy is worth killing.
         """
-        # Check distance
-        if distance > self.OPPORTUNISTIC_KILL_MAX_DISTANCE:
+        # Hoist the tuning attributes (class-level, so each access walks
+        # the MRO) and check the cheap integer predicates first; the
+        # mine-scaled HP heuristic with its division runs only on
+        # candidates that survived everything else
+        my_life = self.hero.life
+        mine_count = enemy.mine_count
+
+        # Don't attack friendly bots
+        if self._friendly_mask & (1 << enemy.id):
             return False
 
-        # Check if we have enough HP
-        if self.hero.life < self.OPPORTUNISTIC_KILL_MIN_OUR_HP:
+        # Check if enemy has enough mines to be worth chasing
+        if mine_count < self._ok_min_enemy_mines:
             return False
 
-        # Check if enemy is weak enough (absolute threshold)
-        if enemy.mine_count <= 1:
-            heuristics_modifier = 1
-        else:
-            heuristics_modifier = enemy.mine_count / 2
-        heuristics_threshold = heuristics_modifier * self.OPPORTUNISTIC_KILL_ENEMY_HP_THRESHOLD
-        if enemy.life > heuristics_threshold:
+        # Check distance
+        if distance > self._ok_max_distance:
             return False
 
-        # Check HP advantage
-        if self.hero.life < enemy.life + self.OPPORTUNISTIC_KILL_HP_ADVANTAGE:
+        # Check if we have enough HP
+        if my_life < self._ok_min_our_hp:
             return False
 
-        # Check if enemy has enough mines to be worth chasing
-        if enemy.mine_count < self.OPPORTUNISTIC_KILL_MIN_ENEMY_MINES:
+        # Check HP advantage
+        if my_life < enemy.life + self._ok_hp_advantage:
             return False
 
-        # Don't attack friendly bots
-        if self.FRIENDLY_FIRE_AVOIDANCE and enemy.id in self._friendly_hero_ids:
+        # Check if enemy is weak enough (mine-scaled threshold)
+        if mine_count <= 1:
+            heuristics_modifier = 1
+        else:
+            heuristics_modifier = mine_count / 2
+        heuristics_threshold = heuristics_modifier * self._ok_enemy_hp_threshold
+        if enemy.life > heuristics_threshold:
             return False
 
         return True
@@ -678,28 +837,32 @@ class CharmingMoleBotV1Minimax(BaseBot):
         Returns:
             tuple: (enemy, distance) of best target, or (None, None) if no target.
         """
-        if not self.OPPORTUNISTIC_KILLS_ENABLED:
+        if not self._ok_enabled:
             return (None, None)
 
-        candidates = []
+        hx = self.hero.x
+        hy = self.hero.y
+
+        # Track the running best instead of collecting and sorting; with
+        # at most three candidates a single max pass is all that's needed
+        best = None
+        best_distance = None
+        best_score = None
 
         for enemy in self._get_enemies():
-            distance = vin.utils.distance_manhattan(
-                self.hero.x, self.hero.y, enemy.x, enemy.y
-            )
+            distance = abs(hx - enemy.x) + abs(hy - enemy.y)
 
             if self._is_enemy_worth_killing(enemy, distance):
                 # Score: prioritize by mines (desc), then low HP, then close distance
                 score = (enemy.mine_count, -enemy.life, -distance)
-                candidates.append((enemy, distance, score))
+                if best_score is None or score > best_score:
+                    best = enemy
+                    best_distance = distance
+                    best_score = score
 
-        if not candidates:
+        if best is None:
             return (None, None)
-
-        # Sort by score (highest first)
-        candidates.sort(key=lambda x: x[2], reverse=True)
-        best = candidates[0]
-        return (best[0], best[1])
+        return (best, best_distance)
 
     def _go_to_enemy(self, enemy):
         """Navigate toward an enemy hero to attack them.
@@ -715,8 +878,21 @@ class CharmingMoleBotV1Minimax(BaseBot):
         x = self.hero.x
         y = self.hero.y
 
-        # Compute path to the enemy
-        path = self.search.find(x, y, enemy.x, enemy.y)
+        # Chases often repeat the same query on consecutive turns (neither
+        # hero moved, or we re-evaluate mid-turn); cache results as long as
+        # mine ownership is unchanged, since captures are what reshape the
+        # obstacle layout the search cares about
+        fingerprint = tuple(mine.owner for mine in self.game.mines)
+        if fingerprint != self._mine_fingerprint:
+            self._path_cache.clear()
+            self._mine_fingerprint = fingerprint
+
+        key = (x, y, enemy.x, enemy.y)
+        if key in self._path_cache:
+            path = self._path_cache[key]
+        else:
+            path = self.search.find(x, y, enemy.x, enemy.y)
+            self._path_cache[key] = path
 
         if path is None:
             return "Stay"
@@ -734,19 +910,13 @@ class CharmingMoleBotV1Minimax(BaseBot):
     def _get_nearby_tavern(self):
         """Find a tavern next to the hero's current position (1 tile away).
 
-        Performance: O(T) where T is number of taverns (typically 4-8).
-        With distance check, effectively O(1) per tavern.
+        Performance: O(1) dict lookup against the tavern-neighbor index
+        built at game start.
 
         Returns:
             Tavern: A neighboring tavern, or None if no tavern is next to us.
         """
-        for tavern in self.game.taverns:
-            dist = vin.utils.distance_manhattan(
-                self.hero.x, self.hero.y, tavern.x, tavern.y
-            )
-            if dist == 1:
-                return tavern
-        return None
+        return self._tavern_by_neighbor.get((self.hero.x, self.hero.y))
 
     def _move_to_nearby_tavern(self, tavern):
         """Get the move command to step into a neighboring tavern.
@@ -786,7 +956,7 @@ class CharmingMoleBotV1Minimax(BaseBot):
             return (True, tavern)
 
         # Normal case: heal if HP < threshold (configurable via class attribute)
-        if self.hero.life < self.NEARBY_TAVERN_HEAL_THRESHOLD:
+        if self.hero.life < self._nearby_heal_threshold:
             return (True, tavern)
 
         return (False, None)
@@ -824,6 +994,8 @@ class CharmingMoleBotV1Minimax(BaseBot):
             self._respawn_turn = self.game.turn
             # Clear cached destination - don't path to old target
             self._cached_destination = None
+            # Cached paths start from the tile we died on
+            self._path_cache.clear()
             return True
 
         return False
@@ -907,14 +1079,14 @@ class CharmingMoleBotV1Minimax(BaseBot):
         phase = self._get_game_phase()
 
         if phase == "opening":
-            base_threshold = self.HP_THRESHOLD_OPENING
+            base_threshold = self._hp_thr_opening
         elif phase == "mid":
-            base_threshold = self.HP_THRESHOLD_MID
+            base_threshold = self._hp_thr_mid
         else:  # end
-            base_threshold = self.HP_THRESHOLD_END
+            base_threshold = self._hp_thr_end
 
         # Add danger modifier: more conservative when enemies nearby
-        danger_modifier = self.DANGER_HP_MODIFIER if danger_level >= 1 else 0
+        danger_modifier = self._danger_hp_modifier if danger_level >= 1 else 0
 
         return base_threshold + danger_modifier
 
@@ -950,7 +1122,7 @@ class CharmingMoleBotV1Minimax(BaseBot):
         turns_holding = remaining - distance
 
         # Not worth it if we'd hold for less than MIN_TURNS_TO_HOLD_MINE
-        if turns_holding < self.MIN_TURNS_TO_HOLD_MINE:
+        if turns_holding < self._min_turns_to_hold_mine:
             return False
 
         # Check if we have enough HP to survive the journey + capture
@@ -987,6 +1159,30 @@ class CharmingMoleBotV1Minimax(BaseBot):
         Returns:
             str: The direction to move ('North', 'South', 'East', 'West', 'Stay').
         """
+        # Paths computed earlier this turn are stale once we move
+        self._turn_paths.clear()
+        self._danger_cache.clear()
+
+        # Index the other heroes by tile so "who is at (x, y)?" checks are
+        # a dict lookup instead of a scan; positions are fixed for the tick
+        self._hero_by_pos = {
+            (hero.x, hero.y): hero
+            for hero in self.game.heroes
+            if hero.id != self.hero.id
+        }
+        self._enemy_tiles = frozenset(
+            (enemy.x, enemy.y) for enemy in self._get_enemies()
+        )
+
+        # One coarse distance pass up front; on most turns every enemy is
+        # far away and the survival helpers can skip their scans entirely
+        hx = self.hero.x
+        hy = self.hero.y
+        self._safe_turn = all(
+            abs(hx - enemy.x) + abs(hy - enemy.y) > 3
+            for enemy in self._get_enemies()
+        )
+
         # Priority 0: Check for respawn and reset strategy
         self._check_and_handle_respawn()
 
@@ -1018,7 +1214,7 @@ class CharmingMoleBotV1Minimax(BaseBot):
                         is_pub_fight = True
                         break
 
-        if danger_level >= self.FLEE_DANGER_THRESHOLD or is_pub_fight:
+        if danger_level >= self._flee_danger_threshold or is_pub_fight:
             # Try to flee
             flee_cmd = self._get_flee_direction(closest_enemy)
             if flee_cmd != "Stay":
@@ -1050,7 +1246,7 @@ class CharmingMoleBotV1Minimax(BaseBot):
         command = self._go_to_nearest_mine()
 
         # Safety check: don't walk into enemies (configurable)
-        if self.DANGER_CHECK_ENABLED and self.hero.life < self.DANGER_CHECK_HP_THRESHOLD:
+        if self._danger_check_enabled and self.hero.life < self._danger_check_hp_threshold:
             if self._would_walk_into_danger(command):
                 safe_cmd = self._find_safe_alternative(command)
                 if safe_cmd:
@@ -1078,9 +1274,19 @@ class CharmingMoleBotV1Minimax(BaseBot):
         Returns:
             bool: True if the move is dangerous (would result in death).
         """
-        next_x, next_y = self._get_position_after_move(command)
+        return self._would_walk_into_danger_at(*self._get_position_after_move(command))
 
-        for enemy in self._get_enemies():
+    def _would_walk_into_danger_at(self, next_x, next_y):
+        """Coordinate-taking variant of _would_walk_into_danger.
+
+        Args:
+            next_x (int): X coordinate of the destination tile.
+            next_y (int): Y coordinate of the destination tile.
+
+        Returns:
+            bool: True if stepping onto the tile is dangerous.
+        """
+        for enemy in self._iter_enemies():
             dist = vin.utils.distance_manhattan(next_x, next_y, enemy.x, enemy.y)
 
             # Would walk into enemy - only dangerous if we'd die
@@ -1112,17 +1318,23 @@ class CharmingMoleBotV1Minimax(BaseBot):
             str: A safer alternative command, or original if ALLOW_STAY_AS_FALLBACK=False.
         """
         # Try all directions except the dangerous one (exclude Stay initially)
-        movement_directions = ["North", "South", "East", "West"]
+        hx = self.hero.x
+        hy = self.hero.y
 
-        for direction in movement_directions:
+        for direction in ("North", "South", "East", "West"):
             if direction == original_command:
                 continue
 
-            if not self._would_walk_into_danger(direction):
-                if not self._would_hit_friendly(direction):
-                    next_x, next_y = self._get_position_after_move(direction)
-                    if self._is_tile_walkable(next_x, next_y):
-                        return direction
+            # Compute the destination once and hand it to every check
+            dx, dy = _MOVE_DELTAS[direction]
+            next_x = hx + dx
+            next_y = hy + dy
+            if (
+                self._is_tile_walkable(next_x, next_y)
+                and not self._would_walk_into_danger_at(next_x, next_y)
+                and not self._would_hit_friendly_at(next_x, next_y)
+            ):
+                return direction
 
         # No safe movement found
         if self.ALLOW_STAY_AS_FALLBACK:
@@ -1189,6 +1401,36 @@ class CharmingMoleBotV1Minimax(BaseBot):
 
         return self._random()
 
+    def _find_path(self, x_, y_):
+        """Find a path from the hero to a goal, reusing this turn's work.
+
+        One decision tick may path to several candidate goals (kill target,
+        taverns, mines). Each result is kept for the rest of the turn; when
+        a later goal lies on a path already computed from the same start
+        tile, the existing prefix is returned instead of searching again.
+
+        Args:
+            x_ (int): Goal x coordinate.
+            y_ (int): Goal y coordinate.
+
+        Returns:
+            list: A list of (x, y) steps, or None if no path exists.
+        """
+        turn_paths = self._turn_paths
+        key = (x_, y_)
+        if key in turn_paths:
+            return turn_paths[key]
+
+        for path in turn_paths.values():
+            if path and key in path:
+                prefix = path[: path.index(key) + 1]
+                turn_paths[key] = prefix
+                return prefix
+
+        path = self.search.find(self.hero.x, self.hero.y, x_, y_)
+        turn_paths[key] = path
+        return path
+
     def _go_to(self, x_, y_):
         """Calculate path to target and return the next move.
 
@@ -1203,7 +1445,7 @@ class CharmingMoleBotV1Minimax(BaseBot):
         y = self.hero.y
 
         # Compute path to the target
-        path = self.search.find(x, y, x_, y_)
+        path = self._find_path(x_, y_)
 
         # Send command to follow that path
         if path is None:
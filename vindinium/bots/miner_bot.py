@@ -11,6 +11,21 @@ from vindinium.ai import AStar
 
 __all__ = ["MinerBot"]
 
+# All five commands; a module-level tuple so the random fallback
+# indexes a constant instead of building a list per call
+_MOVES = ("Stay", "North", "West", "East", "South")
+
+# Command by single-step delta. One dict lookup
+# replaces the branch ladder behind vin.utils.path_to_command on the
+# per-turn output path.
+_CMD = {
+    (0, -1): "North",
+    (0, 1): "South",
+    (-1, 0): "West",
+    (1, 0): "East",
+    (0, 0): "Stay",
+}
+
 
 class MinerBot(BaseBot):
     """Bot that focuses on capturing mines.
@@ -53,9 +68,9 @@ class MinerBot(BaseBot):
         x = self.hero.x
         y = self.hero.y
 
-        # Order mines by distance
-        mines = vin.utils.order_by_distance(x, y, self.game.mines)
-        for mine in mines:
+        # Iterate mines nearest-first, lazily; we usually stop at the
+        # first reachable one, so a full sort is wasted work
+        for mine in vin.utils.iter_by_distance(x, y, self.game.mines):
             # Grab nearest mine that is not owned by this hero
             if mine.owner != self.hero.id:
                 command = self._go_to(mine.x, mine.y)
@@ -75,9 +90,8 @@ class MinerBot(BaseBot):
         x = self.hero.x
         y = self.hero.y
 
-        # Order taverns by distance
-        taverns = vin.utils.order_by_distance(x, y, self.game.taverns)
-        for tavern in taverns:
+        # Iterate taverns nearest-first, lazily
+        for tavern in vin.utils.iter_by_distance(x, y, self.game.taverns):
             command = self._go_to(tavern.x, tavern.y)
 
             if command:
@@ -108,7 +122,7 @@ class MinerBot(BaseBot):
         if len(path) > 0:
             x_, y_ = path[0]
 
-        return vin.utils.path_to_command(x, y, x_, y_)
+        return _CMD[(x_ - x, y_ - y)]
 
     def _random(self):
         """Return a random move.
@@ -116,4 +130,4 @@ class MinerBot(BaseBot):
         Returns:
             str: A randomly chosen direction.
         """
-        return random.choice(["Stay", "North", "West", "East", "South"])
+        return _MOVES[random.randrange(5)]
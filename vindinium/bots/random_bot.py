@@ -9,6 +9,10 @@ from vindinium.bots import RawBot
 
 __all__ = ["RandomBot"]
 
+# All five commands; a module-level tuple so the random fallback
+# indexes a constant instead of building a list per call
+_MOVES = ("Stay", "North", "West", "East", "South")
+
 
 class RandomBot(RawBot):
     """Bot that makes random moves.
@@ -23,4 +27,4 @@ class RandomBot(RawBot):
         Returns:
             str: A randomly chosen direction from 'Stay', 'North', 'West', 'East', 'South'.
         """
-        return random.choice(["Stay", "North", "West", "East", "South"])
+        return _MOVES[random.randrange(5)]
@@ -4,11 +4,24 @@ This module provides the Game class which holds all information about
 the current game state including the map, heroes, mines, and taverns.
 """
 
-import vindinium as vin
+# Constants are bound directly (they exist before the lazily imported
+# model modules load), so hot code does LOAD_GLOBAL instead of a
+# module-attribute lookup per tile
+from vindinium import TILE_EMPTY, TILE_MINE, TILE_SPAWN, TILE_TAVERN, TILE_WALL
 from vindinium.models import Hero, Map, Tavern, Mine
 
 __all__ = ["Game"]
 
+# First tile character -> tile value; any other character is empty.
+# Built once so a whole board classifies in one C-level translate pass.
+_TILE_TABLE = bytes(
+    TILE_WALL if c == ord("#")
+    else TILE_TAVERN if c == ord("[")
+    else TILE_MINE if c == ord("$")
+    else TILE_EMPTY
+    for c in range(256)
+)
+
 
 class Game:
     """Represents a complete game state.
@@ -45,6 +58,11 @@ class Game:
         self.mines = []
         self.taverns = []
 
+        # Per-mine flat index into the raw tile string and the owner char
+        # last seen there, so update() only re-parses owners that changed
+        self._mine_indices = []
+        self._mine_chars = []
+
         # Process the state, creating the objects
         self.__processState(state)
 
@@ -72,9 +90,16 @@ class Game:
             hero.x = hero_state["pos"]["y"]
             hero.y = hero_state["pos"]["x"]
 
-        for mine in self.mines:
-            char = tiles[mine.x * 2 + mine.y * 2 * size + 1]
-            mine.owner = None if char == "-" else int(char)
+        # Delta update: only mines whose owner char actually changed are
+        # re-parsed; the rest is one string read and compare per mine
+        mine_chars = self._mine_chars
+        for i, idx in enumerate(self._mine_indices):
+            char = tiles[idx]
+            if char != mine_chars[i]:
+                mine_chars[i] = char
+                # ord-48 turns the owner digit into an id without the
+                # int() string parser
+                self.mines[i].owner = None if char == "-" else ord(char) - 48
 
     def __processState(self, state):
         """Process the raw state into structured objects.
@@ -88,28 +113,37 @@ class Game:
         board = state["game"]["board"]
         size = board["size"]
         tiles = board["tiles"]
-        tiles = [tiles[i : i + 2] for i in range(0, len(tiles), 2)]
 
-        # run through the map and update map, mines and taverns
+        # Classify every tile at once: the first character of each
+        # 2-char cell determines the type, so translating tiles[::2]
+        # fills the flat row-major board without a Python-level loop
         self.map = Map(size)
-        for y in range(size):
-            for x in range(size):
-                tile = tiles[y * size + x]
-                if tile == "##":
-                    self.map[x, y] = vin.TILE_WALL
-                elif tile == "[]":
-                    self.map[x, y] = vin.TILE_TAVERN
-                    self.taverns.append(Tavern(x, y))
-                elif tile.startswith("$"):
-                    self.map[x, y] = vin.TILE_MINE
-                    self.mines.append(Mine(x, y))
-                else:
-                    self.map[x, y] = vin.TILE_EMPTY
+        flat = self.map._board
+        flat[:] = tiles.encode("ascii")[::2].translate(_TILE_TABLE)
+
+        # Only mines and taverns (a few dozen objects) still need
+        # Python-side construction; locate them with C-level find
+        pos = flat.find(TILE_TAVERN)
+        while pos != -1:
+            y, x = divmod(pos, size)
+            self.taverns.append(Tavern(x, y))
+            pos = flat.find(TILE_TAVERN, pos + 1)
+
+        pos = flat.find(TILE_MINE)
+        while pos != -1:
+            y, x = divmod(pos, size)
+            mine = Mine(x, y)
+            owner = tiles[pos * 2 + 1]
+            mine.owner = None if owner == "-" else int(owner)
+            self.mines.append(mine)
+            self._mine_indices.append(pos * 2 + 1)
+            self._mine_chars.append(owner)
+            pos = flat.find(TILE_MINE, pos + 1)
 
         # create heroes
         for hero in state["game"]["heroes"]:
             pos = hero["spawnPos"]
-            self.map[pos["y"], pos["x"]] = vin.TILE_SPAWN
+            self.map[pos["y"], pos["x"]] = TILE_SPAWN
             self.heroes.append(Hero(hero))
 
     def __str__(self):
@@ -118,26 +152,31 @@ class Game:
         Returns:
             str: ASCII art representation of the game map.
         """
-        s = " "
-        s += "-" * (self.map.size) + "\n"
-        for y in range(self.map.size):
-            s += "|"
-            for x in range(self.map.size):
+        size = self.map.size
+        # One dict lookup per tile instead of scanning the hero list,
+        # and join instead of quadratic string concatenation
+        hero_at = {(h.x, h.y): h for h in self.heroes}
+
+        rows = [" " + "-" * size]
+        for y in range(size):
+            row = ["|"]
+            for x in range(size):
                 tile = self.map[x, y]
-                hero = [h for h in self.heroes if h.x == x and h.y == y]
-
-                if tile == vin.TILE_WALL:
-                    s += "."
-                elif any(hero):
-                    s += str(hero[0].id)
-                elif tile == vin.TILE_SPAWN:
-                    s += "s"
-                elif tile == vin.TILE_MINE:
-                    s += "M"
-                elif tile == vin.TILE_TAVERN:
-                    s += "T"
+                hero = hero_at.get((x, y))
+
+                if tile == TILE_WALL:
+                    row.append(".")
+                elif hero is not None:
+                    row.append(str(hero.id))
+                elif tile == TILE_SPAWN:
+                    row.append("s")
+                elif tile == TILE_MINE:
+                    row.append("M")
+                elif tile == TILE_TAVERN:
+                    row.append("T")
                 else:
-                    s += " "
-            s += "|\n"
-        s += " " + "-" * (self.map.size)
-        return s
+                    row.append(" ")
+            row.append("|")
+            rows.append("".join(row))
+        rows.append(" " + "-" * size)
+        return "\n".join(rows)
@@ -26,6 +26,25 @@ class Hero:
         spawn_y (int): The bot's spawn position on the Y axis.
     """
 
+    # Heroes are read attribute-by-attribute inside the bots' per-turn
+    # loops; slots make those reads descriptor lookups instead of dict
+    # hashes and shrink the instances
+    __slots__ = (
+        "id",
+        "name",
+        "user_id",
+        "elo",
+        "crashed",
+        "mine_count",
+        "gold",
+        "life",
+        "last_dir",
+        "x",
+        "y",
+        "spawn_x",
+        "spawn_y",
+    )
+
     def __init__(self, hero):
         """Initialize a hero from server data.
 
@@ -13,6 +13,10 @@ class Map:
     The map stores information about walls, paths, taverns, mines,
     and spawn points on the game board.
 
+    The board is stored as a single flat bytearray in row-major order
+    (index ``y * size + x``): one allocation, one byte per tile, no
+    boxed ints. Tile values all fit in a byte.
+
     Attributes:
         size (int): The board size (width and height are equal).
     """
@@ -24,7 +28,7 @@ class Map:
             size (int): The board size (creates a size x size grid).
         """
         self.size = size
-        self.__board = [[0 for i in range(size)] for j in range(size)]
+        self._board = bytearray(size * size)
 
     def __getitem__(self, key):
         """Get an item from the map at the given coordinates.
@@ -35,7 +39,7 @@ class Map:
         Returns:
             int: The tile value at the given position.
         """
-        return self.__board[key[0]][key[1]]
+        return self._board[key[1] * self.size + key[0]]
 
     def __setitem__(self, key, value):
         """Set an item in the map at the given coordinates.
@@ -44,7 +48,7 @@ class Map:
             key (tuple): A tuple of (x, y) coordinates.
             value (int): The tile value to set.
         """
-        self.__board[key[0]][key[1]] = value
+        self._board[key[1] * self.size + key[0]] = value
 
     def __str__(self):
         """Return a pretty string representation of the map.
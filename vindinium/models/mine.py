@@ -19,6 +19,8 @@ class Mine:
         owner (int): The hero ID that owns this mine (None if uncaptured).
     """
 
+    __slots__ = ("x", "y", "owner")
+
     def __init__(self, x, y):
         """Initialize a mine at the given position.
 
@@ -17,6 +17,8 @@ class Tavern:
         y (int): The tavern's position on the Y axis.
     """
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         """Initialize a tavern at the given position.
 
@@ -4,6 +4,8 @@ This module provides helper functions for converting between directions and comm
 calculating distances, and ordering objects by distance.
 """
 
+from heapq import heapify, heappop
+
 import vindinium
 
 __all__ = [
@@ -12,8 +14,20 @@ __all__ = [
     "path_to_command",
     "distance_manhattan",
     "order_by_distance",
+    "iter_by_distance",
 ]
 
+# Lookup tables built once from the canonical constants; one dict hash
+# replaces the five-way comparison ladders on the per-step conversion path
+_DIR_TO_CMD = {
+    vindinium.DIR_WEST: vindinium.WEST,
+    vindinium.DIR_EAST: vindinium.EAST,
+    vindinium.DIR_NORTH: vindinium.NORTH,
+    vindinium.DIR_SOUTH: vindinium.SOUTH,
+    vindinium.DIR_STAY: vindinium.STAY,
+}
+_CMD_TO_DIR = {command: direction for direction, command in _DIR_TO_CMD.items()}
+
 
 def dir_to_command(dx, dy):
     """Convert a direction to a command.
@@ -28,18 +42,10 @@ def dir_to_command(dx, dy):
     Raises:
         ValueError: If direction is invalid.
     """
-    if dx == -1 and dy == 0:
-        return vindinium.WEST
-    elif dx == 1 and dy == 0:
-        return vindinium.EAST
-    elif dx == 0 and dy == -1:
-        return vindinium.NORTH
-    elif dx == 0 and dy == 1:
-        return vindinium.SOUTH
-    elif dx == 0 and dy == 0:
-        return vindinium.STAY
-
-    raise ValueError("Invalid direction (%s, %s)." % (dx, dy))
+    try:
+        return _DIR_TO_CMD[(dx, dy)]
+    except KeyError:
+        raise ValueError("Invalid direction (%s, %s)." % (dx, dy)) from None
 
 
 def command_to_dir(command):
@@ -54,18 +60,10 @@ def command_to_dir(command):
     Raises:
         ValueError: If command is invalid.
     """
-    if command == vindinium.NORTH:
-        return vindinium.DIR_NORTH
-    elif command == vindinium.SOUTH:
-        return vindinium.DIR_SOUTH
-    elif command == vindinium.WEST:
-        return vindinium.DIR_WEST
-    elif command == vindinium.EAST:
-        return vindinium.DIR_EAST
-    elif command == vindinium.STAY:
-        return vindinium.DIR_STAY
-
-    raise ValueError('Invalid command "%s".' % command)
+    try:
+        return _CMD_TO_DIR[command]
+    except KeyError:
+        raise ValueError('Invalid command "%s".' % command) from None
 
 
 def path_to_command(x0, y0, x1, y1):
@@ -116,4 +114,33 @@ def order_by_distance(x, y, objects):
     Returns:
         list: An ordered copy of ``objects``.
     """
-    return sorted(objects, key=lambda item: distance_manhattan(x, y, item.x, item.y))
+    # Default args bind x/y as locals of the lambda and the arithmetic is
+    # inlined, skipping a distance_manhattan call frame per comparison
+    return sorted(objects, key=lambda item, x=x, y=y: abs(item.x - x) + abs(item.y - y))
+
+
+def iter_by_distance(x, y, objects):
+    """Iterate objects from nearest to farthest without a full sort.
+
+    Lazy counterpart of ``order_by_distance``: candidates sit in a heap
+    and are popped on demand, so a consumer that stops at the first
+    suitable object (the common bot pattern) pays O(N) to build the heap
+    plus O(log N) per object actually consumed, instead of a full
+    O(N log N) sort and list copy.
+
+    Args:
+        x (int): Position on the X axis.
+        y (int): Position on the Y axis.
+        objects (list): List of objects. The objects must have ``x`` and ``y`` attributes.
+
+    Yields:
+        object: The next nearest object.
+    """
+    heap = [
+        (abs(x - item.x) + abs(y - item.y), i)
+        for i, item in enumerate(objects)
+    ]
+    heapify(heap)
+    while heap:
+        _, i = heappop(heap)
+        yield objects[i]
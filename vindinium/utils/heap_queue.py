@@ -5,6 +5,7 @@ pathfinding algorithms like A*.
 """
 
 import heapq
+from itertools import count
 
 __all__ = ["HeapQueue"]
 
@@ -13,11 +14,22 @@ class HeapQueue:
     """A priority queue implementation using the heapq builtin module.
 
     Based on http://www.redblobgames.com/pathfinding/a-star/implementation.html
+
+    Performance-sensitive callers can skip this wrapper and use
+    ``heapq.heappush``/``heappop`` on a plain list directly, saving one
+    method call per queue operation; the in-tree A* does exactly that.
     """
 
     def __init__(self):
         """Initialize an empty priority queue."""
         self._queue = []
+        # Bound as instance attributes so each call is one attribute load
+        # instead of a module lookup plus method resolution
+        self._push = heapq.heappush
+        self._pop = heapq.heappop
+        # Monotonic tiebreaker: equal priorities never fall through to
+        # comparing the stored items, which may not be orderable
+        self._counter = count()
 
     def is_empty(self):
         """Check if the queue is empty.
@@ -25,7 +37,7 @@ class HeapQueue:
         Returns:
             bool: True if the queue is empty, False otherwise.
         """
-        return len(self._queue) == 0
+        return not self._queue
 
     def push(self, item, priority):
         """Push an item to the queue with a given priority.
@@ -34,7 +46,7 @@ class HeapQueue:
             item (object): Any object to store.
             priority (int): A priority value (lower values have higher priority).
         """
-        heapq.heappush(self._queue, (priority, item))
+        self._push(self._queue, (priority, next(self._counter), item))
 
     def pop(self):
         """Pop the item with the highest priority from the queue.
@@ -42,4 +54,4 @@ class HeapQueue:
         Returns:
             object: The stored item with the highest priority.
         """
-        return heapq.heappop(self._queue)[1]
+        return self._pop(self._queue)[2]
@@ -71,7 +71,9 @@ class Timer:
 
     def tic(self):
         """Start the timer."""
-        self._start_time = time.time()
+        # perf_counter is monotonic (immune to clock adjustments) and has
+        # much finer resolution than wall-clock time.time
+        self._start_time = time.perf_counter()
 
     def toc(self):
         """Stop the timer and return the elapsed time.
@@ -79,5 +81,5 @@ class Timer:
         Returns:
             float: The elapsed time in seconds.
         """
-        self.elapsed = time.time() - self._start_time
+        self.elapsed = time.perf_counter() - self._start_time
         return self.elapsed